@@ -1,5 +1,6 @@
 """Database initialization and session management."""
 
+import functools
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
@@ -53,12 +54,26 @@ def get_keywords(keywords_json_path: Path = KEYWORDS_PATH) -> KeywordsData:
     return load_keywords(keywords_json_path)
 
 
+@functools.lru_cache(maxsize=1)
+def get_cached_card_types() -> CardTypesData:
+    """Get the bundled card types, loaded on first use and shared afterwards."""
+    return get_card_types()
+
+
+@functools.lru_cache(maxsize=1)
+def get_cached_keywords() -> KeywordsData:
+    """Get the bundled keywords, loaded on first use and shared afterwards."""
+    return get_keywords()
+
+
 __all__ = [
     "get_engine", 
     "get_session", 
     "SummaryCardRepository", 
     "get_card_types", 
     "get_keywords",
+    "get_cached_card_types",
+    "get_cached_keywords",
     "InventoryItem",
     "CardTypesData",
     "KeywordsData"
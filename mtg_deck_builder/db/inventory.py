@@ -60,7 +60,8 @@ def load_inventory_items(inventory_file: str, session: Session):
     # Delete all existing inventory items
     session.query(InventoryItem).delete()
     
-    # Add new inventory items
+    # Add new inventory items, handing them to the session in one batch
+    items = []
     total_cards = 0
     for card_name, quantity in inventory_dict['main'].items():
         # Quantity should be no more than 4
@@ -68,9 +69,10 @@ def load_inventory_items(inventory_file: str, session: Session):
             logger.warning(
                 f"Quantity for {card_name} is {quantity}, which is greater than 4"
             )
-        quantity = min(quantity, 4)
-        session.add(InventoryItem(card_name=card_name, quantity=quantity))
+            quantity = 4
+        items.append(InventoryItem(card_name=card_name, quantity=quantity))
         total_cards += quantity
+    session.add_all(items)
     
     logger.info(
         f"Loaded {len(inventory_dict['main'])} inventory items for {total_cards} cards"
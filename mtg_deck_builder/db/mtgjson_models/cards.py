@@ -2,9 +2,38 @@ from sqlalchemy import Column, String, Integer, Float, Text, Boolean, ForeignKey
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from .base import MTGJSONBase
-from typing import List, Optional, Dict, Union
+from typing import FrozenSet, List, Optional, Dict, Union
 import json
-from mtg_deck_builder.models.card import SummaryCard, InventoryItem
+from pydantic import TypeAdapter
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.schema import Column as SAColumn
+from mtg_deck_builder.models.card import (
+    BASIC_LAND_NAMES, COLOR_BITS, SummaryCard, Printing, InventoryItem, encode_colors, color_bits_match,
+)
+
+# Built once: validating the whole printings list in one call reuses the compiled
+# schema instead of entering Printing.model_validate per row.
+_PRINTINGS_ADAPTER = TypeAdapter(List[Printing])
+
+
+def _json_list(v) -> list:
+    """Normalize a JSON list column value (list, JSON text, or unloaded attribute) to a list."""
+    if v is None or isinstance(v, (InstrumentedAttribute, SAColumn)):
+        return []
+    if isinstance(v, list):
+        return v
+    if isinstance(v, str):
+        v = v.strip()
+        if not v:
+            return []
+        try:
+            parsed = json.loads(v)
+            if isinstance(parsed, list):
+                return parsed
+        except Exception:
+            return []
+    return []
+
 
 class MTGJSONCard(MTGJSONBase):
     __tablename__ = "cards"
@@ -331,110 +360,45 @@ class MTGJSONSummaryCard(MTGJSONBase):
 
     @property
     def colors_list(self):
-        v = self.colors
-        from sqlalchemy.orm.attributes import InstrumentedAttribute
-        from sqlalchemy.sql.schema import Column as SAColumn
-        if v is None or isinstance(v, (InstrumentedAttribute, SAColumn)):
-            return []
-        if isinstance(v, list):
-            return v
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                return []
-            try:
-                parsed = json.loads(v)
-                if isinstance(parsed, list):
-                    return parsed
-            except Exception:
-                return []
-        return []
+        return _json_list(self.colors)
 
     @property
     def color_identity_list(self):
-        v = self.color_identity
-        from sqlalchemy.orm.attributes import InstrumentedAttribute
-        from sqlalchemy.sql.schema import Column as SAColumn
-        if v is None or isinstance(v, (InstrumentedAttribute, SAColumn)):
-            return []
-        if isinstance(v, list):
-            return v
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                return []
-            try:
-                parsed = json.loads(v)
-                if isinstance(parsed, list):
-                    return parsed
-            except Exception:
-                return []
-        return []
+        return _json_list(self.color_identity)
 
     @property
     def supertypes_list(self):
-        v = self.supertypes
-        from sqlalchemy.orm.attributes import InstrumentedAttribute
-        from sqlalchemy.sql.schema import Column as SAColumn
-        if v is None or isinstance(v, (InstrumentedAttribute, SAColumn)):
-            return []
-        if isinstance(v, list):
-            return v
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                return []
-            try:
-                parsed = json.loads(v)
-                if isinstance(parsed, list):
-                    return parsed
-            except Exception:
-                return []
-        return []
+        return _json_list(self.supertypes)
 
     @property
     def subtypes_list(self):
-        v = self.subtypes
-        from sqlalchemy.orm.attributes import InstrumentedAttribute
-        from sqlalchemy.sql.schema import Column as SAColumn
-        if v is None or isinstance(v, (InstrumentedAttribute, SAColumn)):
-            return []
-        if isinstance(v, list):
-            return v
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                return []
-            try:
-                parsed = json.loads(v)
-                if isinstance(parsed, list):
-                    return parsed
-            except Exception:
-                return []
-        return []
+        return _json_list(self.subtypes)
 
     @property
     def keywords_list(self):
-        v = self.keywords
-        from sqlalchemy.orm.attributes import InstrumentedAttribute
-        from sqlalchemy.sql.schema import Column as SAColumn
-        if v is None or isinstance(v, (InstrumentedAttribute, SAColumn)):
-            return []
-        if isinstance(v, list):
-            return v
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                return []
-            try:
-                parsed = json.loads(v)
-                if isinstance(parsed, list):
-                    return parsed
-            except Exception:
-                return []
-        return []
+        return _json_list(self.keywords)
+
+    @property
+    def color_identity_bits(self) -> Optional[int]:
+        """
+        Color identity as a WUBRG bitmask, cached until color_identity is reassigned.
+
+        None when the identity holds a symbol outside WUBRG, which a bitmask can't represent.
+        """
+        raw = self.color_identity
+        cached = self.__dict__.get("_ci_bits_cache")
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        identity = self.color_identity_list
+        bits = encode_colors(identity) if all(c in COLOR_BITS for c in identity) else None
+        self._ci_bits_cache = (raw, bits)
+        return bits
 
     def matches_color_identity(self, color_identity, mode="subset", allow_colorless=False):
+        card_bits = self.color_identity_bits
+        if card_bits is not None and all(c in COLOR_BITS for c in color_identity or ()):
+            # Plain WUBRG on both sides: compare bitmasks instead of building two sets
+            return color_bits_match(card_bits, encode_colors(color_identity), mode, allow_colorless)
         card_ci = set(self.color_identity_list)
         query_ci = set(color_identity or [])
         if not allow_colorless and not card_ci:
@@ -447,7 +411,27 @@ class MTGJSONSummaryCard(MTGJSONBase):
             return bool(card_ci & query_ci)
         return False
 
+    @property
+    def colors_bits(self) -> Optional[int]:
+        """
+        Colors as a WUBRG bitmask, cached until colors is reassigned.
+
+        None when the colors hold a symbol outside WUBRG, which a bitmask can't represent.
+        """
+        raw = self.colors
+        cached = self.__dict__.get("_colors_bits_cache")
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        colors = self.colors_list
+        bits = encode_colors(colors) if all(c in COLOR_BITS for c in colors) else None
+        self._colors_bits_cache = (raw, bits)
+        return bits
+
     def matches_colors(self, colors: List[str], mode: str = "subset") -> bool:
+        card_bits = self.colors_bits
+        if card_bits is not None and all(c in COLOR_BITS for c in colors or ()):
+            # Plain WUBRG on both sides: compare bitmasks instead of building two sets
+            return color_bits_match(card_bits, encode_colors(colors), mode, allow_colorless=True)
         card_colors = set(self.colors_list)
         query_colors = set(colors or [])
         if mode == "exact":
@@ -490,20 +474,7 @@ class MTGJSONSummaryCard(MTGJSONBase):
         """
         if not self.type or not self.name:
             return False
-        basic_lands = {
-            "Plains",
-            "Island",
-            "Swamp",
-            "Mountain",
-            "Forest",
-            "Snow-Covered Plains",
-            "Snow-Covered Island",
-            "Snow-Covered Swamp",
-            "Snow-Covered Mountain",
-            "Snow-Covered Forest",
-            "Wastes",
-        }
-        return self.name.strip() in basic_lands
+        return self.name.strip() in BASIC_LAND_NAMES
     
     
     def is_land(self):
@@ -518,29 +489,64 @@ class MTGJSONSummaryCard(MTGJSONBase):
             return False
         return 'Creature' in t
 
+    @property
+    def text_lower(self) -> str:
+        """Lowercased rules text, cached until text is reassigned."""
+        raw = self.text
+        cached = self.__dict__.get("_text_lower_cache")
+        if cached is None or cached[0] is not raw:
+            cached = (raw, raw.lower() if raw else "")
+            self._text_lower_cache = cached
+        return cached[1]
+
+    @property
+    def name_lower(self) -> str:
+        """Lowercased card name, cached until name is reassigned."""
+        raw = self.name
+        cached = self.__dict__.get("_name_lower_cache")
+        if cached is None or cached[0] is not raw:
+            cached = (raw, raw.lower() if raw else "")
+            self._name_lower_cache = cached
+        return cached[1]
+
+    @property
+    def type_lower(self) -> str:
+        """Lowercased type line, cached until type is reassigned."""
+        return self._type_line_cache()[1]
+
+    def _type_line_cache(self):
+        """Return (type, lowercased type, query -> match results), rebuilt when type is reassigned."""
+        raw = self.type
+        cached = self.__dict__.get("_type_cache")
+        if cached is None or cached[0] is not raw:
+            cached = (raw, raw.lower() if raw else "", {})
+            self._type_cache = cached
+        return cached
+
     def matches_type(self, type_query):
-        t = self.type
-        if t is None or type_query is None:
+        if self.type is None or type_query is None:
             return False
-        return type_query.lower() in t.lower()
+        # Analytics ask the same few questions ("creature", "land") of every card repeatedly
+        _, type_lower, results = self._type_line_cache()
+        hit = results.get(type_query)
+        if hit is None:
+            hit = results[type_query] = type_query.lower() in type_lower
+        return hit
         
     def matches_supertype(self, supertype):
-        t = self.type
-        if t is None or supertype is None:
+        if self.type is None or supertype is None:
             return False
-        return supertype.lower() in t.lower()
+        return supertype.lower() in self._type_line_cache()[1]
         
     def matches_subtype(self, subtype):
-        t = self.type
-        if t is None or subtype is None:
+        if self.type is None or subtype is None:
             return False
-        return subtype.lower() in t.lower()
+        return subtype.lower() in self._type_line_cache()[1]
     
     def matches_keyword(self, keyword):
-        txt = self.text
-        if txt is None or keyword is None:
+        if self.text is None or keyword is None:
             return False
-        return keyword.lower() in txt.lower()
+        return keyword.lower() in self.text_lower
     
     def matches_color(self, color):
         colors = self.colors
@@ -548,14 +554,39 @@ class MTGJSONSummaryCard(MTGJSONBase):
             return False
         return color.lower() in [c.lower() for c in colors] if isinstance(colors, list) else color.lower() in str(colors).lower()
     
+    @property
+    def legal_formats(self) -> FrozenSet[str]:
+        """Formats this card is Legal in, cached until legalities is reassigned."""
+        raw = self.legalities
+        cached = self.__dict__.get("_legal_formats_cache")
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        formats = frozenset(f for f, status in (raw or {}).items() if status == "Legal")
+        self._legal_formats_cache = (raw, formats)
+        return formats
+
     def is_legal_in(self, format: Union[str, List[str]]) -> bool:
         if self.legalities is None:
             return False
         if isinstance(format, str):
-            return self.legalities.get(format, "") == "Legal"
+            return format in self.legal_formats
         elif isinstance(format, list):
-            return all(self.legalities.get(f, "") == "Legal" for f in format)
+            return self.legal_formats.issuperset(format)
   
     
     def to_pydantic(self) -> SummaryCard:
-        return SummaryCard.model_validate(self)
\ No newline at end of file
+        """
+        Convert this row to a SummaryCard.
+
+        Column values come from our own summary_cards schema, so the top-level model is
+        built with model_construct instead of re-validating every field. NULL columns are
+        left out so the SummaryCard defaults apply. Printings still go through validation
+        because their list columns are stored as text and need parsing.
+        """
+        # Validation skipped: trusted internal data from the summary_cards table
+        values = {k: v for k, v in self.to_dict().items() if v is not None}
+        return SummaryCard.model_construct(
+            **values,
+            inventory_item=self.inventory_item,
+            printings=_PRINTINGS_ADAPTER.validate_python(list(self.printings)),
+        )
\ No newline at end of file
@@ -11,13 +11,14 @@ Classes:
     - SummaryCardRepository: Query MTGJSONSummaryCard for card summaries.
 """
 
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Protocol, Union
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Protocol, Tuple, Union
 from sqlalchemy import and_, or_, func, text, inspect
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import SQLAlchemyError
 from abc import ABC, abstractmethod
 import logging
 import json
+import numpy as np
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.sql.schema import Column as SAColumn
 
@@ -26,11 +27,15 @@ from mtg_deck_builder.db.mtgjson_models.cards import (
 )
 from mtg_deck_builder.db.mtgjson_models.sets import MTGJSONSet
 from mtg_deck_builder.db.inventory import InventoryItem
+from mtg_deck_builder.models.card import COLOR_BITS, encode_colors, color_bits_match
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Names per IN (...) query in find_by_names; SQLite caps bound parameters (999 on older builds)
+_NAME_BATCH_SIZE = 900
+
 
 class RepositoryError(Exception):
     """Base exception for repository errors."""
@@ -126,6 +131,10 @@ class SummaryCardRepository(BaseRepository):
         """
         super().__init__(session)
         self.cards = cards  # Canonical in-memory set
+        self._legal_masks: Dict[str, np.ndarray] = {}  # format -> bool mask aligned with self.cards
+        # (field, lowered query) -> bool mask aligned with self.cards
+        self._text_masks: Dict[Tuple[str, str], np.ndarray] = {}
+        self._owned_qty_index: Optional[Dict[str, int]] = None  # card name -> owned quantity
 
     def get_all_cards(self) -> List[MTGJSONSummaryCard]:
         """Get all cards from the repository.
@@ -163,8 +172,11 @@ class SummaryCardRepository(BaseRepository):
                 logger.error("summary_cards table is empty! Please run build_summary_cards.py to populate it.")
                 raise DatabaseError("Summary card table is empty")
 
-            # Query all cards from the database
-            query = self.session.query(MTGJSONSummaryCard)
+            # Query all cards from the database; inventory rows come in one extra IN query per
+            # batch rather than a lazy SELECT per card on first .quantity/.owned_qty access
+            query = self.session.query(MTGJSONSummaryCard).options(
+                selectinload(MTGJSONSummaryCard.inventory_item)
+            )
 
             # Process in chunks to avoid memory issues
             BATCH_SIZE = 1000
@@ -186,6 +198,65 @@ class SummaryCardRepository(BaseRepository):
             self._handle_db_error("get_all_cards")
             raise
 
+    def _legal_mask(self, fmt: str) -> np.ndarray:
+        """Return a boolean mask over self.cards marking cards legal in ``fmt``.
+
+        Masks are built once per format and reused by every in-memory filter on this repository.
+        """
+        key = fmt.lower()
+        mask = self._legal_masks.get(key)
+        if mask is None:
+            cards = self.cards or []
+            mask = np.fromiter(
+                ((c.legalities or {}).get(key) == "Legal" for c in cards),
+                dtype=bool,
+                count=len(cards),
+            )
+            self._legal_masks[key] = mask
+        return mask
+
+    def _text_mask(self, field: str, query: str) -> np.ndarray:
+        """Return a boolean mask over self.cards marking cards whose name or text contains ``query``.
+
+        ``field`` is "name" or "text". Deck building repeats the same queries across categories,
+        so each mask is built with one scan and then reused.
+        """
+        key = (field, query.lower())
+        mask = self._text_masks.get(key)
+        if mask is None:
+            cards = self.cards or []
+            needle = key[1]
+            attr = "name_lower" if field == "name" else "text_lower"
+            mask = np.fromiter(
+                (needle in getattr(c, attr) for c in cards),
+                dtype=bool,
+                count=len(cards),
+            )
+            self._text_masks[key] = mask
+        return mask
+
+    def _owned_quantities(self) -> Dict[str, int]:
+        """Return a card name -> owned quantity map for the inventory.
+
+        The map is loaded with a single query on first use and shared with repositories
+        derived from this one, so repeated in-memory filters don't touch the inventory
+        relationship of every card.
+        """
+        if self._owned_qty_index is None:
+            rows = self.session.query(InventoryItem.card_name, InventoryItem.quantity).all()
+            self._owned_qty_index = {name: qty or 0 for name, qty in rows}
+        return self._owned_qty_index
+
+    def clear_inventory_cache(self) -> None:
+        """Forget the cached owned quantities, e.g. after the inventory table is reloaded."""
+        self._owned_qty_index = None
+
+    def _derive(self, cards: List[MTGJSONSummaryCard]) -> 'SummaryCardRepository':
+        """Create an in-memory repository over ``cards`` sharing this repository's inventory cache."""
+        repo = SummaryCardRepository(self.session, cards)
+        repo._owned_qty_index = self._owned_qty_index
+        return repo
+
     def filter_cards(
         self,
         name_query: Optional[str] = None,
@@ -287,7 +358,7 @@ class SummaryCardRepository(BaseRepository):
                 limit=limit,
                 offset=offset
             )
-        return SummaryCardRepository(self.session, filtered)
+        return self._derive(filtered)
 
     def _filter_in_memory(
         self,
@@ -338,8 +409,24 @@ class SummaryCardRepository(BaseRepository):
         logger = logging.getLogger(__name__)
         logger.debug(f"Starting in-memory filtering with {len(cards)} cards")
         filtered = cards
+        if isinstance(legal_in, str):
+            legal_in = [legal_in]
+        # Legality, name and text first: AND the cached per-query masks over the canonical
+        # card list so the remaining per-card checks only see survivors
+        if cards is self.cards and (legal_in or name_query or text_query):
+            mask = np.ones(len(cards), dtype=bool)
+            for fmt in legal_in or ():
+                mask &= self._legal_mask(fmt)
+            if name_query:
+                mask &= self._text_mask("name", name_query)
+            if text_query:
+                mask &= self._text_mask("text", text_query)
+            filtered = [cards[i] for i in np.flatnonzero(mask)]
+            legal_in = name_query = text_query = None
+            logger.debug(f"Count after legalities/name/text: {len(filtered)}")
         if min_quantity > 0:
-            filtered = [c for c in filtered if getattr(c, 'quantity', 0) >= min_quantity]
+            owned = self._owned_quantities()
+            filtered = [c for c in filtered if owned.get(c.name, 0) >= min_quantity]
             logger.debug(f"Count after min_quantity: {len(filtered)}")
         # Filter by type_query
         if type_query:
@@ -366,13 +453,16 @@ class SummaryCardRepository(BaseRepository):
                     logger.debug(f"Sample land card types: {land_cards[0].types_list}")
 
         # Filter by name
+        # Queries are lowered once; cards carry cached lowercase name/text
         if name_query:
-            filtered = [c for c in filtered if name_query.lower() in c.name.lower()]
+            name_lower = name_query.lower()
+            filtered = [c for c in filtered if name_lower in c.name_lower]
             logger.debug(f"Count after name_query: {len(filtered)}")
 
         # Filter by text
         if text_query:
-            filtered = [c for c in filtered if text_query.lower() in c.text.lower()]
+            text_lower = text_query.lower()
+            filtered = [c for c in filtered if text_lower in c.text_lower]
             logger.debug(f"Count after text_query: {len(filtered)}")
 
         # Filter by rarity
@@ -402,29 +492,39 @@ class SummaryCardRepository(BaseRepository):
             filtered = [c for c in filtered if c.has_keywords(keyword_multi)]
             logger.debug(f"Count after keywords: {len(filtered)}")
 
-        # Filter by color identity
+        # Filter by color identity (query mask is encoded once, cards carry cached masks).
+        # Symbols outside WUBRG can't be masked, so those go through the set comparison.
         if color_identity:
-            filtered = [
-                c for c in filtered
-                if c.matches_color_identity(
-                    color_identity=color_identity,
-                    mode=color_mode,
-                    allow_colorless=allow_colorless
-                )
-            ]
+            if all(sym in COLOR_BITS for sym in color_identity):
+                query_bits = encode_colors(color_identity)
+                filtered = [
+                    c for c in filtered
+                    if (
+                        color_bits_match(c.color_identity_bits, query_bits, color_mode, allow_colorless)
+                        if c.color_identity_bits is not None
+                        else c.matches_color_identity(color_identity, color_mode, allow_colorless)
+                    )
+                ]
+            else:
+                filtered = [
+                    c for c in filtered
+                    if c.matches_color_identity(color_identity, color_mode, allow_colorless)
+                ]
             logger.debug(f"Count after color_identity: {len(filtered)}")
 
         # Filter by exclude type
         if exclude_type:
+            excluded = [t.lower() for t in exclude_type]
             filtered = [
                 c for c in filtered
-                if not any(t.lower() in c.type.lower() for t in exclude_type)
+                if not any(t in c.type_lower for t in excluded)
             ]
             logger.debug(f"Count after exclude_type: {len(filtered)}")
 
         # Filter by names
         if names_in:
-            filtered = [c for c in filtered if c.name in names_in]
+            wanted = set(names_in)
+            filtered = [c for c in filtered if c.name in wanted]
             logger.debug(f"Count after names_in: {len(filtered)}")
 
         # Filter by legalities
@@ -470,34 +570,40 @@ class SummaryCardRepository(BaseRepository):
         logger = logging.getLogger(__name__)
         
         # Initialize base query with eager loading of inventory_item
-        from sqlalchemy.orm import joinedload
-        base_query = self.session.query(MTGJSONSummaryCard).options(
-            joinedload(MTGJSONSummaryCard.inventory_item)
-        )
+        from sqlalchemy.orm import joinedload, contains_eager
+        base_query = self.session.query(MTGJSONSummaryCard)
         logger.debug("Starting SQLAlchemy query for summary cards with eager loading")
 
         # Handle min_quantity filter by joining with inventory table
         if min_quantity > 0:
             from mtg_deck_builder.db.inventory import InventoryItem
+            # Populate inventory_item from the filter join instead of joining the table twice
             base_query = base_query.join(InventoryItem, InventoryItem.card_name == MTGJSONSummaryCard.name)
+            base_query = base_query.options(contains_eager(MTGJSONSummaryCard.inventory_item))
             base_query = base_query.filter(InventoryItem.quantity >= min_quantity)
             logger.debug(f"SQL: Joined with inventory and filtered for quantity >= {min_quantity}")
+        else:
+            base_query = base_query.options(joinedload(MTGJSONSummaryCard.inventory_item))
 
-        # Log initial query state
-        initial_count = base_query.count()
-        logger.debug(f"Initial query count before filters: {initial_count}")
+        # Row counts and sample values below cost an extra query each, so they only
+        # run when debug logging is actually enabled.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Initial query count before filters: {base_query.count()}")
 
         # Check legalities format
         if legal_in:
             if isinstance(legal_in, str):
                 legal_in = [legal_in]
             
-            sample_legalities = self.session.query(MTGJSONSummaryCard.legalities).limit(1).scalar()
-            logger.debug(f"Sample legalities format: {sample_legalities}")
+            if debug:
+                sample_legalities = self.session.query(MTGJSONSummaryCard.legalities).limit(1).scalar()
+                logger.debug(f"Sample legalities format: {sample_legalities}")
 
             # Try a simpler approach first - just check if the field exists
             base_query = base_query.filter(MTGJSONSummaryCard.legalities.isnot(None))
-            logger.debug(f"Count after legalities not null: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after legalities not null: {base_query.count()}")
             
             # Use LIKE to find legal cards with case-insensitive matching
             conditions = []
@@ -509,25 +615,30 @@ class SummaryCardRepository(BaseRepository):
             
             if conditions:
                 base_query = base_query.filter(or_(*conditions))
-                logger.debug(f"Count after legalities filter: {base_query.count()}")
+                if debug:
+                    logger.debug(f"Count after legalities filter: {base_query.count()}")
 
         if name_query:
             logger.debug(f"SQL: Filtering by name_query: {name_query}")
             base_query = base_query.filter(MTGJSONSummaryCard.name.ilike(f"%{name_query}%"))
-            logger.debug(f"Count after name_query: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after name_query: {base_query.count()}")
         if text_query:
             logger.debug(f"SQL: Filtering by text_query: {text_query}")
             base_query = base_query.filter(MTGJSONSummaryCard.text.ilike(f"%{text_query}%"))
-            logger.debug(f"Count after text_query: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after text_query: {base_query.count()}")
         if rarity:
             logger.debug(f"SQL: Filtering by rarity: {rarity}")
             base_query = base_query.filter(MTGJSONSummaryCard.rarity == rarity)
-            logger.debug(f"Count after rarity: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after rarity: {base_query.count()}")
         if type_query:
             logger.debug(f"SQL: Filtering by type_query: {type_query}")
             # Debug the types field
-            sample = self.session.query(MTGJSONSummaryCard.types).limit(1).scalar()
-            logger.debug(f"Sample types value: {sample}")
+            if debug:
+                sample = self.session.query(MTGJSONSummaryCard.types).limit(1).scalar()
+                logger.debug(f"Sample types value: {sample}")
             
             if isinstance(type_query, list):
                 conditions = []
@@ -540,9 +651,11 @@ class SummaryCardRepository(BaseRepository):
                 base_query = base_query.filter(MTGJSONSummaryCard.types.contains([type_query]))
             
             # Debug the query
-            logger.debug(f"SQL query after type filter: {base_query}")
-            count = base_query.count()
-            logger.debug(f"Count after type_query: {count}")
+            count = None
+            if debug:
+                logger.debug(f"SQL query after type filter: {base_query}")
+                count = base_query.count()
+                logger.debug(f"Count after type_query: {count}")
             
             # If count is 0, let's check what types we actually have
             if count == 0:
@@ -568,27 +681,32 @@ class SummaryCardRepository(BaseRepository):
                 base_query = base_query.filter(and_(*conditions))
             else:
                 base_query = base_query.filter(~MTGJSONSummaryCard.types.contains([exclude_type]))
-            logger.debug(f"Count after exclude_type: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after exclude_type: {base_query.count()}")
         if names_in:
             logger.debug(f"SQL: Filtering by names_in: {names_in}")
             base_query = base_query.filter(MTGJSONSummaryCard.name.in_(names_in))
-            logger.debug(f"Count after names_in: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after names_in: {base_query.count()}")
         if add_where:
             logger.debug(f"SQL: Applying additional where clause: {add_where}")
             base_query = base_query.filter(add_where)
-            logger.debug(f"Count after add_where: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after add_where: {base_query.count()}")
         if basic_type:
             logger.debug(f"SQL: Filtering by basic_type: {basic_type}")
             if isinstance(basic_type, str):
                 basic_type = [basic_type]
             
             # Debug the types field
-            sample = self.session.query(MTGJSONSummaryCard.types).limit(1).scalar()
-            logger.debug(f"Sample types value: {sample}")
+            if debug:
+                sample = self.session.query(MTGJSONSummaryCard.types).limit(1).scalar()
+                logger.debug(f"Sample types value: {sample}")
             
             conditions = [MTGJSONSummaryCard.types.contains([bt]) for bt in basic_type]
             base_query = base_query.filter(or_(*conditions))
-            logger.debug(f"Count after basic_type: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after basic_type: {base_query.count()}")
         if supertype:
             logger.debug(f"SQL: Filtering by supertype: {supertype}")
             if isinstance(supertype, str):
@@ -596,7 +714,8 @@ class SummaryCardRepository(BaseRepository):
             
             conditions = [MTGJSONSummaryCard.supertypes.contains([st]) for st in supertype]
             base_query = base_query.filter(or_(*conditions))
-            logger.debug(f"Count after supertype: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after supertype: {base_query.count()}")
         if subtype:
             logger.debug(f"SQL: Filtering by subtype: {subtype}")
             if isinstance(subtype, str):
@@ -604,7 +723,8 @@ class SummaryCardRepository(BaseRepository):
             
             conditions = [MTGJSONSummaryCard.subtypes.contains([st]) for st in subtype]
             base_query = base_query.filter(or_(*conditions))
-            logger.debug(f"Count after subtype: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after subtype: {base_query.count()}")
 
         # # Colors filter
         # if color_identity:
@@ -638,12 +758,14 @@ class SummaryCardRepository(BaseRepository):
         if keyword_multi:
             logger.debug(f"SQL: Filtering by keyword_multi: {keyword_multi}")
             # Debug the keywords field
-            sample = self.session.query(MTGJSONSummaryCard.keywords).limit(1).scalar()
-            logger.debug(f"Sample keywords value: {sample}")
+            if debug:
+                sample = self.session.query(MTGJSONSummaryCard.keywords).limit(1).scalar()
+                logger.debug(f"Sample keywords value: {sample}")
             
             conditions = [MTGJSONSummaryCard.keywords.contains([kw]) for kw in keyword_multi]
             base_query = base_query.filter(or_(*conditions))
-            logger.debug(f"Count after keyword_multi: {base_query.count()}")
+            if debug:
+                logger.debug(f"Count after keyword_multi: {base_query.count()}")
 
         if limit is not None:
             logger.debug(f"SQL: Applying limit: {limit}")
@@ -732,6 +854,39 @@ class SummaryCardRepository(BaseRepository):
             self._handle_db_error("find_by_name")
             raise
 
+    def find_by_names(self, names: List[str]) -> Dict[str, MTGJSONSummaryCard]:
+        """Find summary cards for many exact names at once.
+
+        Args:
+            names: Card names to find (exact, case-sensitive like find_by_name)
+
+        Returns:
+            Dict mapping each found name to its card; missing names are left out
+        """
+        wanted = set(names)
+        if not wanted:
+            return {}
+        try:
+            found: Dict[str, MTGJSONSummaryCard] = {}
+            if self.cards is not None:
+                for c in self.cards:
+                    if c.name in wanted and c.name not in found:
+                        found[c.name] = c
+                return found
+
+            # Chunked to stay under SQLite's bound-parameter limit
+            wanted_list = list(wanted)
+            for start in range(0, len(wanted_list), _NAME_BATCH_SIZE):
+                chunk = wanted_list[start:start + _NAME_BATCH_SIZE]
+                for c in self.session.query(MTGJSONSummaryCard).filter(
+                    MTGJSONSummaryCard.name.in_(chunk)
+                ):
+                    found.setdefault(c.name, c)
+            return found
+        except SQLAlchemyError:
+            self._handle_db_error("find_by_names")
+            raise
+
     def get_printings(self, name: str) -> List[str]:
         """Get all set codes where a card has been printed."""
         try:
@@ -769,6 +924,42 @@ class SummaryCardRepository(BaseRepository):
         except SQLAlchemyError:
             self._handle_db_error("get_legalities")
             raise
+
+    def get_legalities_by_names(self, names: List[str]) -> Dict[str, Dict[str, str]]:
+        """Get legality information for many cards at once.
+
+        Only the name and legalities columns are loaded, so no card objects are built.
+
+        Args:
+            names: Exact card names to look up
+
+        Returns:
+            Dict mapping each found name to its format -> status dict; missing names are left out
+        """
+        wanted = set(names)
+        if not wanted:
+            return {}
+        try:
+            if self.cards is not None:
+                return {
+                    c.name: c.legalities or {}
+                    for c in self.cards
+                    if c.name in wanted
+                }
+
+            found: Dict[str, Dict[str, str]] = {}
+            wanted_list = list(wanted)
+            for start in range(0, len(wanted_list), _NAME_BATCH_SIZE):
+                chunk = wanted_list[start:start + _NAME_BATCH_SIZE]
+                rows = self.session.query(
+                    MTGJSONSummaryCard.name, MTGJSONSummaryCard.legalities
+                ).filter(MTGJSONSummaryCard.name.in_(chunk))
+                for name, legalities in rows:
+                    found[name] = legalities or {}
+            return found
+        except SQLAlchemyError:
+            self._handle_db_error("get_legalities_by_names")
+            raise
         
     def __repr__(self) -> str:
         return f"<SummaryCardRepository(cards={len(self.cards) if self.cards else 'database'})>"
@@ -778,12 +969,16 @@ class SummaryCardRepository(BaseRepository):
         Return a new SummaryCardRepository with only cards that have inventory_item.quantity >= min_quantity.
         """
         if self.cards is not None:
-            filtered = [c for c in self.cards if c.inventory_item is not None and c.inventory_item.quantity >= min_quantity]
-            return SummaryCardRepository(self.session, filtered)
+            owned = self._owned_quantities()
+            filtered = [c for c in self.cards if c.name in owned and owned[c.name] >= min_quantity]
+            return self._derive(filtered)
         else:
-            # Query the database and join inventory
+            # Query the database and join inventory; the joined rows also populate
+            # inventory_item so callers don't lazy-load it once per owned card.
+            from sqlalchemy.orm import contains_eager
             from mtg_deck_builder.db.inventory import InventoryItem
             query = self.session.query(MTGJSONSummaryCard).join(InventoryItem, InventoryItem.card_name == MTGJSONSummaryCard.name)
+            query = query.options(contains_eager(MTGJSONSummaryCard.inventory_item))
             query = query.filter(InventoryItem.quantity >= min_quantity)
             cards = query.all()
             return SummaryCardRepository(self.session, cards)
\ No newline at end of file
@@ -1,7 +1,40 @@
-from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, field_validator
+from typing import Optional, List, Dict, Any, Union, Iterable, Tuple, Final
+from pydantic import BaseModel, PrivateAttr, field_validator
 import json
 
+# --- Color identity bitmasks ---
+# One bit per WUBRG symbol so color identity checks are single integer ops.
+COLOR_BITS: Dict[str, int] = {"W": 1, "U": 2, "B": 4, "R": 8, "G": 16}
+
+_COLOR_MODE_MATCHERS = {
+    "exact": lambda card_bits, query_bits: card_bits == query_bits,
+    "subset": lambda card_bits, query_bits: (card_bits & ~query_bits) == 0,
+    "any": lambda card_bits, query_bits: (card_bits & query_bits) != 0,
+}
+
+def encode_colors(colors: Optional[Iterable[str]]) -> int:
+    """Encode a list of color symbols as a WUBRG bitmask (unknown symbols are ignored)."""
+    bits = 0
+    for c in colors or ():
+        bits |= COLOR_BITS.get(c, 0)
+    return bits
+
+def color_bits_match(card_bits: int, query_bits: int, mode: str = "subset", allow_colorless: bool = False) -> bool:
+    """Compare two WUBRG bitmasks using the 'exact', 'subset' or 'any' color mode."""
+    if not allow_colorless and not card_bits:
+        return False
+    matcher = _COLOR_MODE_MATCHERS.get(mode)
+    return matcher(card_bits, query_bits) if matcher else False
+
+# --- Basic lands ---
+# Built once at import; membership tests replace per-call list/set literals.
+BASIC_LAND_NAMES: Final[frozenset[str]] = frozenset({
+    "Plains", "Island", "Swamp", "Mountain", "Forest",
+    "Snow-Covered Plains", "Snow-Covered Island", "Snow-Covered Swamp",
+    "Snow-Covered Mountain", "Snow-Covered Forest",
+    "Wastes",
+})
+
 # --- Utilities for list/dict parsing ---
 def parse_text_list(val: Optional[Union[str, List[str]]]) -> List[str]:
     if not val:
@@ -146,7 +179,7 @@ class Printing(BaseModel):
     originalPrintings: List[str] = []
     originalReleaseDate: Optional[str]
     originalText: Optional[str]
-    originalType: Optional[str]
+    originalType: Optional[str] = None  # not stored in the cards table
     otherFaceIds: List[str] = []
     power: Optional[str]
     printings: List[str] = []
@@ -231,6 +264,8 @@ class SummaryCard(BaseModel):
     inventory_item: Optional[Any] = None
     printings: List[Printing] = []
 
+    _ci_bits_cache: Optional[Tuple[Any, Optional[int]]] = PrivateAttr(default=None)
+
     class Config:
         from_attributes = True
     
@@ -266,7 +301,27 @@ class SummaryCard(BaseModel):
     def keywords_list(self):
         return self.keywords or []
 
+    @property
+    def color_identity_bits(self) -> Optional[int]:
+        """
+        Color identity as a WUBRG bitmask, cached until color_identity is reassigned.
+
+        None when the identity holds a symbol outside WUBRG, which a bitmask can't represent.
+        """
+        raw = self.color_identity
+        cached = self._ci_bits_cache
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        identity = self.color_identity_list
+        bits = encode_colors(identity) if all(c in COLOR_BITS for c in identity) else None
+        self._ci_bits_cache = (raw, bits)
+        return bits
+
     def matches_color_identity(self, color_identity, mode="subset", allow_colorless=False):
+        card_bits = self.color_identity_bits
+        if card_bits is not None and all(c in COLOR_BITS for c in color_identity or ()):
+            # Plain WUBRG on both sides: compare bitmasks instead of building two sets
+            return color_bits_match(card_bits, encode_colors(color_identity), mode, allow_colorless)
         card_ci = set(self.color_identity_list)
         query_ci = set(color_identity or [])
         if not allow_colorless and not card_ci:
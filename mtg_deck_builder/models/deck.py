@@ -1,24 +1,31 @@
 import random
+from bisect import bisect_right
+from itertools import accumulate
 from typing import List, Dict, Optional, Set, Tuple, Any, Union, TYPE_CHECKING, Mapping, cast, MutableMapping
 from pathlib import Path
-import pandas as pd
 import json
 from sqlalchemy.orm import Session
 import logging
-from mtg_deck_builder.db import get_card_types, get_keywords
+from mtg_deck_builder.db import get_cached_card_types, get_cached_keywords
+from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
 from mtg_deck_builder.models.deck_config import DeckConfig, DeckMeta
 from mtg_deck_builder.yaml_builder.types import LandStub
 
-from mtg_deck_builder.models.card_meta import load_card_types, load_keywords
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from mtg_deck_builder.models.card_meta import CardTypesData, KeywordsData
     from mtg_deck_builder.db.repository import SummaryCardRepository
-    from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
 
 logger = logging.getLogger(__name__)
 
 def load_json(path):
-    with open(path, 'r') as f:
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 class Deck:
@@ -29,14 +36,19 @@ class Deck:
     """
     session: Optional[Session] = None
     name: str = ""
-    _keywords: 'KeywordsData' = get_keywords()
-    _card_types: 'CardTypesData' = get_card_types()
+    # model_dump() of the shared keyword/card-type data, keyed by name -> (source model, dump)
+    _meta_dumps: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
 
 
     def __init__(self, cards: Optional[Union[Dict[str, 'MTGJSONSummaryCard'], List['MTGJSONSummaryCard']]] = None, 
                  session: Optional[Session] = None, 
                  name: str = "",
                  config: Optional[DeckConfig] = None):
+        self._version: int = 0  # bumped on every change to cards/inventory
+        self._draw_pool_cache: Optional[Tuple[int, List[Any], List[int]]] = None  # (version, cards, cumulative qty)
+        self._size_cache: Optional[Tuple[int, int]] = None  # (version, total quantity)
+        # (version, [(card, lowercased types)], type query -> matching cards)
+        self._type_index_cache: Optional[Tuple[int, List[Tuple[Any, str]], Dict[str, List[Any]]]] = None
         self.session: Optional[Session] = session
         self.name: str = name
         self.config: Optional[DeckConfig] = config  # Placeholder for DeckConfig, if needed
@@ -63,15 +75,43 @@ class Deck:
             raise ValueError("cards must be a dict or a list of CardDB")
         logger.debug(f"Deck initialized with {len(self.cards)} cards: {list(self.cards.keys())}")
 
+    @property
+    def cards(self) -> MutableMapping[str, Union['LandStub', 'MTGJSONSummaryCard']]:
+        return self._cards
+
+    @cards.setter
+    def cards(self, value: MutableMapping[str, Union['LandStub', 'MTGJSONSummaryCard']]) -> None:
+        self._cards = value
+        self._version += 1
+
+    @property
+    def inventory(self) -> Dict[str, int]:
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, value: Dict[str, int]) -> None:
+        self._inventory = value
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Change counter for the deck contents.
+
+        Incremented by insert_card and whenever cards or inventory is reassigned, so
+        analyzers can reuse results computed for the same version.
+        """
+        return self._version
+
     @property
     def keywords(self) -> 'KeywordsData':
         """Lazily load keywords data."""
-        return self._keywords   
+        return get_cached_keywords()
 
     @property
     def card_types(self) -> 'CardTypesData':
         """Lazily load card types data."""
-        return self._card_types
+        return get_cached_card_types()
 
     def __repr__(self) -> str:
         """
@@ -101,11 +141,9 @@ class Deck:
             
         selected = all_cards[:limit] if limit else all_cards
         cards_dict = {str(card.name): card for card in selected}
-        inventory = {str(card.name): 1 for card in selected}
         deck_config = DeckConfig(deck=DeckMeta(name=name, size=limit))
-        deck = cls(cards=cards_dict, session=repo.session, config=deck_config, name=name)
-        deck.inventory = inventory
-        return deck
+        # __init__ already gives every card in a dict a quantity of 1
+        return cls(cards=cards_dict, session=repo.session, config=deck_config, name=name)
 
     def insert_card(self, card: Union['MTGJSONSummaryCard', 'LandStub'], quantity: int = 1) -> None:
         """
@@ -115,6 +153,7 @@ class Deck:
             card: Card to insert
             quantity: Number of copies to add.
         """
+        self._version += 1
         if card.name in self.cards:
             # If card exists, add to its quantity
             self.inventory[str(card.name)] += quantity
@@ -143,10 +182,27 @@ class Deck:
         Returns:
             List[CardDB]: List of drawn cards.
         """
-        deck_list = [card for card in self.cards.values() for _ in range(self.get_quantity(str(card.name)))]
-        if hand_size > len(deck_list):
+        cards, cumulative = self._draw_pool()
+        total = cumulative[-1] if cumulative else 0
+        if hand_size > total:
             raise ValueError("Hand size exceeds the number of cards in the deck.")
-        return random.sample(deck_list, hand_size)
+        # Pick distinct copy positions, then map each to its card through the running totals
+        return [cards[bisect_right(cumulative, i)] for i in random.sample(range(total), hand_size)]
+
+    def _draw_pool(self) -> Tuple[List[Any], List[int]]:
+        """
+        Return the deck's cards with their cumulative quantities, rebuilt only when the deck changes.
+
+        Repeated draws (opening hand simulations) then cost O(hand_size * log(unique cards))
+        each, without expanding the deck into one entry per copy.
+        """
+        cached = self._draw_pool_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1], cached[2]
+        cards = list(self.cards.values())
+        cumulative = list(accumulate(self.get_quantity(name) for name in self.cards))
+        self._draw_pool_cache = (self._version, cards, cumulative)
+        return cards, cumulative
 
     def size(self) -> int:
         """
@@ -155,14 +211,36 @@ class Deck:
         Returns:
             int: Total number of cards in the deck.
         """
-        return sum(self.inventory.values())
+        # Analysis and export call this several times per deck; sum once per version
+        cached = self._size_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        total = sum(self.inventory.values())
+        self._size_cache = (self._version, total)
+        return total
 
     def cards_by_type(self, type_match: str) -> List['MTGJSONSummaryCard']:
         """
         Return a list of cards that match a specific type (case-insensitive substring match).
         """
         type_match = type_match.lower()
-        matching_cards = []
+        type_strings, results = self._type_index()
+        matching_cards = results.get(type_match)
+        if matching_cards is None:
+            matching_cards = results[type_match] = [card for card, type_str in type_strings if type_match in type_str]
+        return list(matching_cards)
+
+    def _type_index(self) -> Tuple[List[Tuple[Any, str]], Dict[str, List[Any]]]:
+        """
+        Return each card with its lowercased type string, plus memoized cards_by_type results.
+
+        Both are rebuilt only when the deck changes, so repeated type queries skip the
+        per-card join/lower and answer from the memo.
+        """
+        cached = self._type_index_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1], cached[2]
+        type_strings = []
         for card in self.cards.values():
             card_types = getattr(card, "types", [])
             if isinstance(card_types, list):
@@ -171,17 +249,26 @@ class Deck:
             else:
                 # Handle types as a string
                 type_str = str(card_types or "").lower()
-            if type_match in type_str:
-                matching_cards.append(card)
-        return matching_cards
+            type_strings.append((card, type_str))
+        results: Dict[str, List[Any]] = {}
+        self._type_index_cache = (self._version, type_strings, results)
+        return type_strings, results
 
     def search_cards(self, text: str) -> List['MTGJSONSummaryCard']:
         """
         Return all cards containing a text fragment (case-insensitive, in card name or text).
         """
         text = text.lower()
-        return [card for card in self.cards.values()
-                if text in (getattr(card, "name", "") or "").lower() or text in (getattr(card, "oracle_text", "") or "").lower()]
+        matches = []
+        for card in self.cards.values():
+            if isinstance(card, MTGJSONSummaryCard):
+                # Lowercased name is cached on the card, so repeated searches skip re-lowering
+                name_lower = card.name_lower
+            else:
+                name_lower = (getattr(card, "name", "") or "").lower()
+            if text in name_lower or text in (getattr(card, "oracle_text", "") or "").lower():
+                matches.append(card)
+        return matches
 
     def to_dict(self, eager: bool = False) -> Dict[str, Any]:
         """Convert deck to a dictionary representation.
@@ -192,13 +279,32 @@ class Deck:
         Returns:
             Dictionary containing deck data cards and quantities, config as well
         """
+        return self._to_dict(share_meta=False)
+
+    def _to_dict(self, share_meta: bool) -> Dict[str, Any]:
+        """
+        Build the to_dict() payload.
+
+        With share_meta the keyword and card-type entries are the cached dumps from
+        _meta_dump, which every deck shares. Only use that for output that is serialized
+        straight away (to_json), never for a dict handed back to callers.
+        """
+        if share_meta:
+            keywords = self._meta_dump('keywords', self.keywords) if self.keywords else None
+            card_types = self._meta_dump('card_types', self.card_types) if self.card_types else None
+        else:
+            keywords = self.keywords.model_dump() if self.keywords else None
+            card_types = self.card_types.model_dump() if self.card_types else None
+
         # Store minimal card data - just name and quantity
+        inventory = self.inventory
         cards_dict = {
             name: {
-                'name': card.name,
-                'quantity': self.get_quantity(name)
-            } for name, card in self.cards.items()
+                'name': name,
+                'quantity': inventory.get(name, 0)
+            } for name in self.cards
         }
+        size = self.size()
 
         # Store minimal deck data
         deck_data = {
@@ -206,13 +312,28 @@ class Deck:
             'cards': cards_dict,
             'config': self.config.model_dump() if self.config else None,
             'inventory': self.inventory,
-            'keywords': self.keywords.model_dump() if self.keywords else None,
-            'card_types': self.card_types.model_dump() if self.card_types else None,
-            'size': self.size() if self.size() else None
+            'keywords': keywords,
+            'card_types': card_types,
+            'size': size if size else None
         }
         
         return deck_data
 
+    @classmethod
+    def _meta_dump(cls, key: str, model: Any) -> Dict[str, Any]:
+        """
+        Return model.model_dump(), reused while the same model object is loaded.
+
+        The keyword and card-type data is shared by every deck and never changes, so
+        dumping it once avoids a full Pydantic traversal per to_json call. The returned
+        dict is shared, so it is only used for output that is serialized immediately.
+        """
+        cached = cls._meta_dumps.get(key)
+        if cached is None or cached[0] is not model:
+            cached = (model, model.model_dump())
+            cls._meta_dumps[key] = cached
+        return cached[1]
+
     def to_json(self, path: Optional[Union[str, Path]] = None) -> Optional[str]:
         """Convert deck to JSON format.
         
@@ -222,12 +343,20 @@ class Deck:
         Returns:
             JSON string if path is None, None otherwise.
         """
-        import json
-        data = self.to_dict(eager=True)  # Always eager load for full serialization
+        # Serialized straight away, so the shared keyword/card-type dumps can't leak
+        data = self._to_dict(share_meta=True)
+        if orjson is not None:
+            # Same 2-space layout as json.dumps(indent=2); non-str keys are stringified like
+            # json does. orjson emits UTF-8 bytes, so write them as-is rather than through
+            # the locale encoding
+            json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            if path:
+                Path(path).write_bytes(json_bytes)
+                return None
+            return json_bytes.decode()
         json_str = json.dumps(data, indent=2)
         if path:
-            with open(path, 'w') as f:
-                f.write(json_str)
+            Path(path).write_text(json_str, encoding="utf-8")
             return None
         return json_str
 
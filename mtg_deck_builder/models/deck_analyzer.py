@@ -1,172 +1,330 @@
-from collections import defaultdict
-from typing import List, Dict, Optional, Set, Tuple, Any, TYPE_CHECKING
+import re
+from collections import Counter, defaultdict
+from typing import List, Dict, Optional, Set, FrozenSet, Tuple, Any, Final, NamedTuple, TYPE_CHECKING
 from pathlib import Path
-from mtg_deck_builder.db import get_card_types, get_keywords    
+from mtg_deck_builder.db import get_cached_card_types, get_cached_keywords
+from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
 from mtg_deck_builder.models.card_meta import TypeEntry
 from mtg_deckbuilder_ui.app_config import app_config
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 if TYPE_CHECKING:
     from mtg_deck_builder.models.deck import Deck
 
 KEYWORDS_PATH = Path("data/mtgjson/keywords.json")
 CARDTYPES_PATH = Path("data/mtgjson/CardTypes.json")
-CARD_TYPES = get_card_types()
-KEYWORDS = get_keywords()
+
+RAMP_PHRASES: Final[Tuple[str, ...]] = (
+    "search your library for a land", "add {", "add one mana", "add two mana",
+    "add three mana", "create a treasure", "create a powerstone", "create one mana",
+    "add mana of any color", "add one mana of any type", "add one mana of any color",
+)
+# One alternation scans each card's text once instead of one substring test per phrase
+_RAMP_PATTERN = re.compile("|".join(re.escape(p) for p in RAMP_PHRASES))
+
+
+# Type lines separate subtypes with an em dash ("Creature — Elf Druid"); accept a plain hyphen too
+_SUBTYPE_SEPARATOR = re.compile(r"\s[—-]\s")
+
+# Printed power/toughness is numeric or a variable like "*" / "1+*"
+_NUMERIC_STAT = re.compile(r"\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)\s*")
+
+
+def _parse_stat(value, default: float = 1.0) -> float:
+    """Parse a power/toughness value, returning ``default`` for variable or missing stats."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and _NUMERIC_STAT.fullmatch(value):
+        return float(value)
+    return default
+
+
+def _curve_stat(value) -> Optional[float]:
+    """Parse a stat for the power/toughness curve: missing counts as 0, variable stats as None."""
+    if not value:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and _NUMERIC_STAT.fullmatch(value):
+        return float(value)
+    return None
+
+
+def _build_automaton(phrases):
+    """Build an Aho-Corasick automaton over ``phrases``, or None when pyahocorasick is missing."""
+    if ahocorasick is None or not phrases:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+# Shared by every analyzer; the ramp phrases don't depend on the deck
+_RAMP_AUTOMATON = _build_automaton(RAMP_PHRASES)
+
+
+def _has_ramp_text(text: str) -> bool:
+    """Return True if lowercased card text contains any ramp phrase."""
+    if _RAMP_AUTOMATON is not None:
+        return next(_RAMP_AUTOMATON.iter(text), None) is not None
+    return _RAMP_PATTERN.search(text) is not None
+
+class _CardRow(NamedTuple):
+    """Per-card values shared by the analyzer passes, computed once per deck version."""
+    card: Any
+    text: str  # lowercased oracle text
+    qty: int  # copies in the deck
+    keywords: Set[str]  # known keywords found in text
+    is_ramp: bool  # text contains a ramp phrase
+    is_creature: bool  # type line matches "creature"
+    is_land: bool  # type line matches "land"
+
 
 class DeckAnalyzer:
     """
     Handles analysis of a Deck object.
     """
-    _ALL_KEYWORDS: Optional[Set[str]] = None
-    _ALL_CREATURE_TYPES: Optional[Set[str]] = None
+    # Shared by every analyzer instance, so built once and frozen
+    _ALL_KEYWORDS: Optional[FrozenSet[str]] = None
+    _ALL_CREATURE_TYPES: Optional[FrozenSet[str]] = None
+    _KW_AUTOMATON = None  # Aho-Corasick automaton over _ALL_KEYWORDS when pyahocorasick is installed
 
     def __init__(self, deck: 'Deck'):
         self.deck = deck
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None  # (deck version, stats)
+        self._rows_cache: Optional[Tuple[int, List[_CardRow]]] = None  # (deck version, rows)
+        self._synergy_cache: Optional[Tuple[int, float]] = None  # (deck version, score)
         self._load_keyword_and_type_sets()
 
     @classmethod
     def _load_keyword_and_type_sets(cls):
         if cls._ALL_KEYWORDS is None or cls._ALL_CREATURE_TYPES is None:
+            keywords = get_cached_keywords()
             all_keywords = set()
             for key in ("keywordAbilities", "keywordActions", "abilityWords"):
                 method_name = f"get_{key.lower()}"
-                method = getattr(KEYWORDS, method_name, None)
+                method = getattr(keywords, method_name, None)
                 if callable(method):
                     all_keywords.update([k.lower() for k in method()])
-            cls._ALL_KEYWORDS = all_keywords
+            cls._ALL_KEYWORDS = frozenset(all_keywords)
+            cls._KW_AUTOMATON = _build_automaton(cls._ALL_KEYWORDS)
             
-            # Get creature subtypes from the data structure
-            creature_data = CARD_TYPES.data.get("creature", TypeEntry())
-            cls._ALL_CREATURE_TYPES = set(creature_data.subTypes)
+            # Get creature subtypes from the data structure, lowercased like the
+            # type lines they are compared against
+            creature_data = get_cached_card_types().data.get("creature", TypeEntry())
+            cls._ALL_CREATURE_TYPES = frozenset(t.lower() for t in creature_data.subTypes)
 
-    def average_mana_value(self) -> float:
-        total_mv = sum((getattr(card, "converted_mana_cost", 0) or 0) * getattr(card, "owned_qty", 1) for card in self.deck.cards.values())
-        total_cards = sum(getattr(card, "owned_qty", 1) for card in self.deck.cards.values())
-        return total_mv / total_cards if total_cards else 0.0
+    def _card_rows(self) -> List[_CardRow]:
+        """
+        Return a _CardRow for every card in the deck.
 
-    def average_power_toughness(self) -> Tuple[float, float]:
-        def parse_stat(value) -> float:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 1.0
+        Built once per deck version: each oracle text is lowercased and scanned for
+        keywords and ramp phrases a single time, the creature/land type checks are
+        made once, and every analyzer pass reads the precomputed values.
+        """
+        version = self.deck.version
+        if self._rows_cache is not None and self._rows_cache[0] == version:
+            return self._rows_cache[1]
+        inventory = self.deck.inventory
+        rows = []
+        for name, card in self.deck.cards.items():
+            if isinstance(card, MTGJSONSummaryCard):
+                text = card.text_lower  # cached on the card across analyses
+            else:
+                text = (getattr(card, "text", "") or "").lower()
+            rows.append(_CardRow(
+                card, text, inventory.get(name, 0), self._keywords_in(text), _has_ramp_text(text),
+                card.matches_type("creature"), card.matches_type("land"),
+            ))
+        self._rows_cache = (version, rows)
+        return rows
+
+    def _keywords_in(self, text: str) -> Set[str]:
+        """Return the known keywords occurring in lowercased card text."""
+        if self._KW_AUTOMATON is not None:
+            # One pass over the text instead of one substring test per keyword
+            return {kw for _, kw in self._KW_AUTOMATON.iter(text)}
+        return {kw for kw in self._ALL_KEYWORDS or () if kw in text}
+
+    def summary_stats(self) -> Dict[str, Any]:
+        """
+        Compute the per-card deck statistics in a single pass over the deck.
+
+        The result is reused until the deck's version changes.
+
+        Returns:
+            Dict with avg_mana_value, avg_power, avg_toughness, color_identity, color_balance,
+            type_counts, land_count, ramp_count, mana_curve, power_toughness_curve,
+            land_breakdown, rarity_breakdown, keyword_summary, max_cmc and expensive_cards.
+        """
+        version = self.deck.version
+        if self._stats_cache is not None and self._stats_cache[0] == version:
+            return self._stats_cache[1]
+        stats = self._compute_summary_stats()
+        self._stats_cache = (version, stats)
+        return stats
+
+    def _compute_summary_stats(self) -> Dict[str, Any]:
+        total_mv = 0.0
+        total_cards = 0
         total_power = 0.0
         total_toughness = 0.0
         creature_count = 0
-        for card in self.deck.cards.values():
-            if card.matches_type("creature"):
-                qty = getattr(card, "owned_qty", 1)
-                total_power += parse_stat(getattr(card, "power", None)) * qty
-                total_toughness += parse_stat(getattr(card, "toughness", None)) * qty
+        land_count = 0
+        ramp_count = 0
+        color_set: Set[str] = set()
+        color_counts: Dict[str, int] = defaultdict(int)
+        type_counts: Counter = Counter()
+        cmc_counts: Dict[Any, int] = defaultdict(int)
+        pt_counts: Dict[Tuple[float, float], int] = defaultdict(int)
+        land_breakdown: Dict[str, int] = {}
+        rarity_breakdown: Dict[str, int] = defaultdict(int)
+        keyword_counts: Dict[str, int] = defaultdict(int)
+        max_cmc = 0
+        expensive_cards: List[str] = []
+
+        for card, _, qty, keywords, is_ramp, is_creature, is_land in self._card_rows():
+            cmc = getattr(card, "converted_mana_cost", 0) or 0
+            total_mv += cmc * qty
+            total_cards += qty
+            if cmc > max_cmc:
+                max_cmc = cmc
+                expensive_cards = [card.name]
+            elif cmc == max_cmc:
+                expensive_cards.append(card.name)
+            rarity_breakdown[getattr(card, "rarity", "Common")] += qty
+            for keyword in keywords:
+                keyword_counts[keyword] += qty
+
+            if is_creature:
+                power = getattr(card, "power", None)
+                toughness = getattr(card, "toughness", None)
+                total_power += _parse_stat(power) * qty
+                total_toughness += _parse_stat(toughness) * qty
                 creature_count += qty
-        if creature_count == 0:
-            return (0.0, 0.0)
-        return (total_power / creature_count, total_toughness / creature_count)
+                # Creatures with variable stats ("*") are left off the curve
+                curve_power, curve_toughness = _curve_stat(power), _curve_stat(toughness)
+                if curve_power is not None and curve_toughness is not None:
+                    pt_counts[(curve_power, curve_toughness)] += qty
+            if is_land:
+                land_count += qty
+                land_breakdown[card.name] = qty
+            else:
+                cmc_counts[7 if cmc >= 7 else cmc] += qty
 
-    def deck_color_identity(self) -> Set[str]:
-        color_set = set()
-        for card in self.deck.cards.values():
-            # First try to get colors from the colors field
+            # First try to get colors from the colors field; fall back to
+            # color_identity (for dual lands), then count as colorless
             colors = getattr(card, "colors", None)
-            if colors and isinstance(colors, (list, tuple)):
-                color_set.update(colors)
-            else:
-                # If colors is empty, try color_identity (for dual lands)
-                color_identity = getattr(card, "color_identity", None)
-                if color_identity and isinstance(color_identity, (list, tuple)):
-                    color_set.update(color_identity)
-                else:
-                    color_set.add("C")
+            if not (colors and isinstance(colors, (list, tuple))):
+                colors = getattr(card, "color_identity", None)
+                if not (colors and isinstance(colors, (list, tuple))):
+                    colors = ("C",)
+            color_set.update(colors)
+            for col in colors:
+                color_counts[col] += qty
+
+            # Ensure card.types is iterable and contains only strings; each type
+            # counts once per copy in the deck
+            card_types = getattr(card, "types", [])
+            if isinstance(card_types, (list, tuple)):
+                type_counts.update({t: qty for t in card_types if isinstance(t, str)})
+
+            if is_ramp:
+                ramp_count += qty
+
         if len(color_set) > 1 and "C" in color_set:
             color_set.remove("C")
-        return color_set
+        return {
+            "avg_mana_value": total_mv / total_cards if total_cards else 0.0,
+            "avg_power": total_power / creature_count if creature_count else 0.0,
+            "avg_toughness": total_toughness / creature_count if creature_count else 0.0,
+            "color_identity": color_set,
+            "color_balance": dict(color_counts),
+            "type_counts": dict(type_counts),
+            "land_count": land_count,
+            "ramp_count": ramp_count,
+            "mana_curve": dict(cmc_counts),
+            "power_toughness_curve": dict(pt_counts),
+            "land_breakdown": land_breakdown,
+            "rarity_breakdown": dict(rarity_breakdown),
+            "keyword_summary": {k: v for k, v in keyword_counts.items() if v > 0},
+            "max_cmc": max_cmc,
+            "expensive_cards": expensive_cards,
+        }
+
+    def average_mana_value(self) -> float:
+        return self.summary_stats()["avg_mana_value"]
+
+    def average_power_toughness(self) -> Tuple[float, float]:
+        stats = self.summary_stats()
+        return (stats["avg_power"], stats["avg_toughness"])
+
+    def deck_color_identity(self) -> Set[str]:
+        return set(self.summary_stats()["color_identity"])
 
     def color_balance(self) -> Dict[str, int]:
-        color_counts: Dict[str, int] = {}
-        for card in self.deck.cards.values():
-            qty = self.deck.get_quantity(card.name)
-            
-            # First try to get colors from the colors field
-            colors = getattr(card, "colors", None)
-            if colors and isinstance(colors, (list, tuple)):
-                for col in colors:
-                    color_counts[col] = color_counts.get(col, 0) + qty
-            else:
-                # If colors is empty, try color_identity (for dual lands)
-                color_identity = getattr(card, "color_identity", None)
-                if color_identity and isinstance(color_identity, (list, tuple)):
-                    for col in color_identity:
-                        color_counts[col] = color_counts.get(col, 0) + qty
-                else:
-                    # If both are empty, count as colorless
-                    color_counts["C"] = color_counts.get("C", 0) + qty
-        return color_counts
+        return dict(self.summary_stats()["color_balance"])
 
     def count_mana_ramp(self) -> int:
-        ramp_count = 0
-        for card in self.deck.cards.values():
-            text = (getattr(card, "text", "") or "").lower()
-            qty = self.deck.get_quantity(card.name)
-            if any(phrase in text for phrase in [
-                "search your library for a land", "add {", "add one mana", "add two mana",
-                "add three mana", "create a treasure", "create a powerstone", "create one mana",
-                "add mana of any color", "add one mana of any type", "add one mana of any color"
-            ]):
-                ramp_count += qty
-        return ramp_count
+        return self.summary_stats()["ramp_count"]
 
     def count_lands(self) -> int:
-        return sum(self.deck.get_quantity(card.name) for card in self.deck.cards.values() if card.matches_type("land"))
+        return self.summary_stats()["land_count"]
 
     def land_breakdown(self) -> Dict[str, int]:
-        return {card.name: self.deck.get_quantity(card.name) for card in self.deck.cards.values() if card.matches_type("land")}
+        return dict(self.summary_stats()["land_breakdown"])
 
     def count_card_types(self) -> Dict[str, int]:
-        type_counts: Dict[str, int] = defaultdict(int)
-        for card in self.deck.cards.values():
-            # Ensure card.types is iterable and contains only strings
-            card_types = getattr(card, "types", [])
-            if not isinstance(card_types, (list, tuple)):
-                continue
-            for t in card_types:
-                # Only count if t is a string
-                if isinstance(t, str):
-                    type_counts[t] += self.deck.get_quantity(card.name)
-        return type_counts
+        return dict(self.summary_stats()["type_counts"])
 
     def synergy_score(self) -> float:
+        version = self.deck.version
+        if self._synergy_cache is not None and self._synergy_cache[0] == version:
+            return self._synergy_cache[1]
+        score = self._compute_synergy_score()
+        self._synergy_cache = (version, score)
+        return score
+
+    def _compute_synergy_score(self) -> float:
         if not self.deck.cards:
             return 0.0
+        rows = self._card_rows()
         creature_types = set()
         if self._ALL_CREATURE_TYPES:
-            for card in self.deck.cards.values():
-                if card.matches_type("creature"):
-                    type_line = getattr(card, "type", "").lower()
-                    if " - " in type_line:
-                        subtypes = type_line.split(" - ")[1].split()
-                        for t in subtypes:
-                            if t in self._ALL_CREATURE_TYPES:
-                                creature_types.add(t)
+            for row in rows:
+                if row.is_creature:
+                    parts = _SUBTYPE_SEPARATOR.split((getattr(row.card, "type", "") or "").lower(), maxsplit=1)
+                    if len(parts) == 2:
+                        creature_types.update(t for t in parts[1].split() if t in self._ALL_CREATURE_TYPES)
         type_synergy_count = 0
-        for card in self.deck.cards.values():
-            text = (getattr(card, "text", "") or "").lower()
-            for creature_type in creature_types:
-                if creature_type in text:
-                    type_synergy_count += self.deck.get_quantity(card.name)
+        type_automaton = _build_automaton(creature_types) if len(creature_types) > 1 else None
+        for row in rows:
+            text, qty = row.text, row.qty
+            if type_automaton is not None:
+                # Each distinct creature type mentioned counts once, as in the substring loop
+                type_synergy_count += qty * len({t for _, t in type_automaton.iter(text)})
+            else:
+                type_synergy_count += qty * sum(1 for t in creature_types if t in text)
         keywords = {}
         if self._ALL_KEYWORDS:
-            for card in self.deck.cards.values():
-                text = (getattr(card, "text", "") or "").lower()
-                for keyword in self._ALL_KEYWORDS:
-                    if keyword in text:
-                        keywords[keyword] = keywords.get(keyword, 0) + self.deck.get_quantity(card.name)
+            for row in rows:
+                for keyword in row.keywords:
+                    keywords[keyword] = keywords.get(keyword, 0) + row.qty
         keyword_synergy_count = 0
-        if self._ALL_KEYWORDS:
-            for card in self.deck.cards.values():
-                text = (getattr(card, "text", "") or "").lower()
-                for keyword, count in keywords.items():
-                    if count > 1 and keyword in text and f"with {keyword}" in text:
-                        keyword_synergy_count += self.deck.get_quantity(card.name)
+        # "with <keyword>" contains the keyword itself, so one phrase test per keyword suffices
+        with_phrases = [f"with {keyword}" for keyword, count in keywords.items() if count > 1]
+        if with_phrases:
+            for row in rows:
+                text = row.text
+                if "with " not in text:
+                    continue
+                keyword_synergy_count += row.qty * sum(1 for phrase in with_phrases if phrase in text)
         total_cards = self.deck.size()
         synergy_percentage = (type_synergy_count + keyword_synergy_count) / total_cards if total_cards else 0.0
         return min(10.0, synergy_percentage * 10)
@@ -187,70 +345,22 @@ class DeckAnalyzer:
         return "\n".join(result)
 
     def mana_curve(self) -> dict:
-        cmc_counts = {}
-        for card in self.deck.cards.values():
-            if card.matches_type("land"):
-                continue
-            cmc = getattr(card, "converted_mana_cost", 0) or 0
-            cmc = 7 if cmc >= 7 else cmc
-            cmc_counts[cmc] = cmc_counts.get(cmc, 0) + self.deck.get_quantity(card.name)
-        return cmc_counts
+        return dict(self.summary_stats()["mana_curve"])
 
     def power_toughness_curve(self) -> dict:
-        pt_counts = {}
-        for card in self.deck.cards.values():
-            if card.matches_type("creature"):
-                try:
-                    power = float(getattr(card, "power", 0) or 0)
-                    toughness = float(getattr(card, "toughness", 0) or 0)
-                    key = (power, toughness)
-                    pt_counts[key] = pt_counts.get(key, 0) + self.deck.get_quantity(card.name)
-                except Exception:
-                    continue
-        return pt_counts
+        return dict(self.summary_stats()["power_toughness_curve"])
 
     def keyword_summary(self) -> Dict[str, int]:
-        keywords = self._ALL_KEYWORDS
-        if not keywords:
-            return {}
-        summary = {k: 0 for k in keywords}
-        for card in self.deck.cards.values():
-            text = (getattr(card, "text", "") or "").lower()
-            for k in keywords:
-                if k in text:
-                    summary[k] += self.deck.get_quantity(card.name)
-        return {k: v for k, v in summary.items() if v > 0}
+        return dict(self.summary_stats()["keyword_summary"])
 
     def count_keywords(self, keyword: str) -> int:
         keyword = keyword.lower()
-        count = 0
-        for card in self.deck.cards.values():
-            text = (getattr(card, "text", "") or "").lower()
-            if keyword in text:
-                count += self.deck.get_quantity(card.name)
-        return count
-
-    def _stringify_keys(self, d: Dict[Any, Any]) -> Dict[str, Any]:
-        if not isinstance(d, dict):
-            return d
-        return {str(k): self._stringify_keys(v) for k, v in d.items()}
+        return sum(row.qty for row in self._card_rows() if keyword in row.text)
 
     def summary_dict(self) -> Dict[str, Any]:
-        avg_power, avg_toughness = self.average_power_toughness()
-        expensive_cards = []
-        max_cmc = 0
-        for card in self.deck.cards.values():
-            cmc = getattr(card, "converted_mana_cost", 0) or 0
-            if cmc > max_cmc:
-                max_cmc = cmc
-                expensive_cards = [card.name]
-            elif cmc == max_cmc:
-                expensive_cards.append(card.name)
-        rarity_breakdown = {}
-        for card in self.deck.cards.values():
-            rarity = getattr(card, "rarity", "Common")
-            rarity_breakdown[rarity] = rarity_breakdown.get(rarity, 0) + self.deck.get_quantity(card.name)
-        keyword_counts = self.keyword_summary()
+        # Everything except synergy and the sample hand comes from the one cached pass
+        stats = self.summary_stats()
+        keyword_counts = stats["keyword_summary"]
         frequent_keywords = []
         if keyword_counts:
             max_count = max(keyword_counts.values())
@@ -258,25 +368,26 @@ class DeckAnalyzer:
         summary = {
             "name": self.deck.name,
             "total_cards": self.deck.size(),
-            "land_count": self.count_lands(),
-            "spell_count": self.deck.size() - self.count_lands(),
-            "avg_mana_value": round(self.average_mana_value(), 2),
-            "color_balance": self.color_balance(),
-            "color_identity": list(self.deck_color_identity()),
-            "type_counts": self.count_card_types(),
-            "ramp_count": self.count_mana_ramp(),
-            "lands": self.count_lands(),
-            "avg_power": round(avg_power, 2),
-            "avg_toughness": round(avg_toughness, 2),
+            "land_count": stats["land_count"],
+            "spell_count": self.deck.size() - stats["land_count"],
+            "avg_mana_value": round(stats["avg_mana_value"], 2),
+            "color_balance": dict(stats["color_balance"]),
+            "color_identity": list(stats["color_identity"]),
+            "type_counts": dict(stats["type_counts"]),
+            "ramp_count": stats["ramp_count"],
+            "lands": stats["land_count"],
+            "avg_power": round(stats["avg_power"], 2),
+            "avg_toughness": round(stats["avg_toughness"], 2),
             "synergy": round(self.synergy_score(), 2),
-            "mana_curve": self.mana_curve(),
-            "power_toughness_curve": self.power_toughness_curve(),
-            "keyword_summary": self.keyword_summary(),
-            "land_breakdown": self.land_breakdown(),
-            "rarity_breakdown": rarity_breakdown,
-            "max_cmc": max_cmc,
-            "expensive_cards": expensive_cards,
+            # Only these three can carry non-string keys (numbers, (power, toughness) tuples, None)
+            "mana_curve": {str(k): v for k, v in stats["mana_curve"].items()},
+            "power_toughness_curve": {str(k): v for k, v in stats["power_toughness_curve"].items()},
+            "keyword_summary": dict(keyword_counts),
+            "land_breakdown": dict(stats["land_breakdown"]),
+            "rarity_breakdown": {str(k): v for k, v in stats["rarity_breakdown"].items()},
+            "max_cmc": stats["max_cmc"],
+            "expensive_cards": list(stats["expensive_cards"]),
             "sample_hand": [card.name for card in self.deck.sample_hand(7)],
             "frequent_keywords": frequent_keywords
         }
-        return self._stringify_keys(summary) 
\ No newline at end of file
+        return summary
\ No newline at end of file
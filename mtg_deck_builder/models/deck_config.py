@@ -20,11 +20,32 @@ Classes:
 
 """
 
+import functools
 import yaml
 from pathlib import Path
 from typing import List, Dict, Optional, Union, Any, Literal
 from pydantic import BaseModel, Field, validator, model_validator
 
+# LibYAML-backed loader/dumper when PyYAML was built with it; same safe semantics either way
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, reusing the result while the file is unchanged.
+
+    mtime_ns and size are only part of the cache key, so editing the file
+    forces a fresh parse. The returned data is shared between calls and must
+    not be mutated; DeckConfig validation copies it into new models.
+    """
+    # Bytes let the parser detect the encoding without a text-decode layer
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 class PriorityCardEntry(BaseModel):
     """
@@ -103,6 +124,9 @@ class DeckMeta(BaseModel):
         if v is None:
             return []
         if isinstance(v, list):
+            # Configs usually list colors already normalized ("W", "U"); skip the rebuild then
+            if all(type(c) is str and c.isupper() and c.strip() == c for c in v):
+                return v
             return [str(c).strip().upper() for c in v if str(c).strip()]
         return [str(v).strip().upper()] if str(v).strip() else []
 
@@ -323,14 +347,31 @@ class DeckConfig(BaseModel):
         if isinstance(path_or_str, (str, Path)):
             path = Path(path_or_str)
             if path.exists():
-                with open(path, "r") as f:
-                    data = yaml.safe_load(f)
+                stat = path.stat()
+                data = _load_yaml_file(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
             else:
                 raise FileNotFoundError(f"YAML file not found: {path}")
         else:
-            data = yaml.safe_load(path_or_str)
+            data = yaml.load(path_or_str, Loader=_YamlLoader)
         return cls(**data)
 
+    @classmethod
+    def from_many_yaml(cls, paths: List[Union[str, Path]]) -> List["DeckConfig"]:
+        """
+        Load several DeckConfig YAML files.
+
+        Args:
+            paths: Paths to YAML files.
+
+        Returns:
+            DeckConfig instances in the same order as paths.
+
+        Raises:
+            FileNotFoundError: If any path doesn't exist.
+            yaml.YAMLError: If any file fails to parse.
+        """
+        return [cls.from_yaml(path) for path in paths]
+
     def to_yaml(self, path: Optional[Union[str, Path]] = None) -> Optional[str]:
         """
         Convert the configuration to YAML.
@@ -342,7 +383,7 @@ class DeckConfig(BaseModel):
             YAML string if path is None, None otherwise.
         """
         data = self.model_dump(exclude_none=True)
-        yaml_str = yaml.dump(data, default_flow_style=False)
+        yaml_str = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False)
         if path:
             with open(path, "w") as f:
                 f.write(yaml_str)
@@ -359,10 +400,8 @@ class DeckConfig(BaseModel):
         Returns:
             JSON string representation of the configuration.
         """
-        import json
-
-        data = self.model_dump(exclude_none=True)
-        json_str = json.dumps(data, indent=2)
+        # Serialized directly by pydantic-core, without an intermediate dict
+        json_str = self.model_dump_json(exclude_none=True, indent=2)
         if path:
             with open(path, "w", encoding="utf-8") as f:
                 f.write(json_str)
@@ -1,4 +1,4 @@
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Final, FrozenSet, Optional, TYPE_CHECKING
 import pandas as pd
 
 from mtg_deck_builder.models.deck_analyzer import DeckAnalyzer
@@ -6,6 +6,31 @@ from mtg_deck_builder.models.deck_analyzer import DeckAnalyzer
 if TYPE_CHECKING:
     from mtg_deck_builder.models.deck import Deck
 
+# Legalities that mark a deck as commander-style (separate Commander section on export)
+_COMMANDER_FORMATS: Final[FrozenSet[str]] = frozenset(("commander", "brawl", "historicbrawl", "standardbrawl"))
+
+_CONFIG_DUMP_METHODS: Dict[type, Optional[str]] = {}  # config class -> dump method name
+
+
+def _dump_config(cfg: Any) -> Optional[Dict[str, Any]]:
+    """
+    Dump a deck config to a dict via model_dump, to_dict or as_dict, else its __dict__.
+
+    Which method a config class offers is resolved once per class, not probed on
+    every export.
+    """
+    cls = type(cfg)
+    try:
+        method = _CONFIG_DUMP_METHODS[cls]
+    except KeyError:
+        method = next((name for name in ("model_dump", "to_dict", "as_dict") if hasattr(cls, name)), None)
+        _CONFIG_DUMP_METHODS[cls] = method
+    if method is not None:
+        return getattr(cfg, method)()
+    if hasattr(cfg, "__dict__"):
+        return dict(cfg.__dict__)
+    return None
+
 
 class DeckExporter:
     """
@@ -14,6 +39,18 @@ class DeckExporter:
 
     def __init__(self, deck: 'Deck'):
         self.deck = deck
+        self._analyzer: Optional[DeckAnalyzer] = None
+
+    def _get_analyzer(self) -> DeckAnalyzer:
+        """
+        Return a DeckAnalyzer for the current deck, reused across exports.
+
+        The analyzer caches its statistics per deck version, so repeated exports of
+        an unchanged deck skip the analysis pass.
+        """
+        if self._analyzer is None or self._analyzer.deck is not self.deck:
+            self._analyzer = DeckAnalyzer(self.deck)
+        return self._analyzer
 
     def _safe_convert_power_toughness(self, value):
         """
@@ -39,21 +76,37 @@ class DeckExporter:
         Returns:
             DataFrame with deck data
         """
-        rows = []
-        for card in self.deck.cards.values():
-            rows.append({
-                "Name": getattr(card, "name", ""),
-                "Quantity": getattr(card, "owned_qty", 1),
-                "Mana Cost": getattr(card, "mana_cost", ""),
-                "Converted Mana Cost": getattr(card, "converted_mana_cost", 0),
-                "Card Type": getattr(card, "type", ""),
-                "Power": self._safe_convert_power_toughness(getattr(card, "power", None)) if card.matches_type("creature") else None,
-                "Toughness": self._safe_convert_power_toughness(getattr(card, "toughness", None)) if card.matches_type("creature") else None,
-                "Text": getattr(card, "text", ""),
-                "Rarity": getattr(card, "rarity", ""),
-                "Colors": ", ".join(getattr(card, "colors", []) or [])
-            })
-        return pd.DataFrame(rows)
+        # Build the columns directly so pandas doesn't transpose a list of row dicts
+        names, quantities, mana_costs, cmcs, card_types = [], [], [], [], []
+        powers, toughnesses, texts, rarities, colors = [], [], [], [], []
+        inventory = self.deck.inventory
+        convert = self._safe_convert_power_toughness
+        for name, card in self.deck.cards.items():
+            is_creature = card.matches_type("creature")
+            names.append(getattr(card, "name", ""))
+            quantities.append(inventory.get(name, 0))
+            mana_costs.append(getattr(card, "mana_cost", ""))
+            cmcs.append(getattr(card, "converted_mana_cost", 0))
+            card_types.append(getattr(card, "type", ""))
+            powers.append(convert(getattr(card, "power", None)) if is_creature else None)
+            toughnesses.append(convert(getattr(card, "toughness", None)) if is_creature else None)
+            texts.append(getattr(card, "text", ""))
+            rarities.append(getattr(card, "rarity", ""))
+            colors.append(", ".join(getattr(card, "colors", []) or []))
+        if not names:
+            return pd.DataFrame()
+        return pd.DataFrame({
+            "Name": names,
+            "Quantity": quantities,
+            "Mana Cost": mana_costs,
+            "Converted Mana Cost": cmcs,
+            "Card Type": card_types,
+            "Power": powers,
+            "Toughness": toughnesses,
+            "Text": texts,
+            "Rarity": rarities,
+            "Colors": colors,
+        })
 
     def as_json(self) -> Dict[str, Any]:
         """
@@ -63,15 +116,18 @@ class DeckExporter:
             Dict containing deck data
         """
         card_list = []
-        for card in self.deck.cards.values():
+        inventory = self.deck.inventory
+        convert = self._safe_convert_power_toughness
+        for name, card in self.deck.cards.items():
+            is_creature = card.matches_type("creature")
             card_list.append({
                 "name": getattr(card, "name", ""),
-                "quantity": getattr(card, "owned_qty", 1),
+                "quantity": inventory.get(name, 0),
                 "mana_cost": getattr(card, "mana_cost", ""),
                 "converted_mana_cost": getattr(card, "converted_mana_cost", 0),
                 "type": getattr(card, "type", ""),
-                "power": self._safe_convert_power_toughness(getattr(card, "power", None)) if card.matches_type("creature") else None,
-                "toughness": self._safe_convert_power_toughness(getattr(card, "toughness", None)) if card.matches_type("creature") else None,
+                "power": convert(getattr(card, "power", None)) if is_creature else None,
+                "toughness": convert(getattr(card, "toughness", None)) if is_creature else None,
                 "text": getattr(card, "text", ""),
                 "rarity": getattr(card, "rarity", ""),
                 "colors": getattr(card, "colors", []) or []
@@ -79,17 +135,9 @@ class DeckExporter:
             
         deck_config_json = None
         if hasattr(self.deck, "config") and self.deck.config is not None:
-            cfg = self.deck.config
-            if hasattr(cfg, "model_dump"):
-                deck_config_json = cfg.model_dump()
-            elif hasattr(cfg, "to_dict"):
-                deck_config_json = cfg.to_dict()
-            elif hasattr(cfg, "as_dict"):
-                deck_config_json = cfg.as_dict()
-            elif hasattr(cfg, "__dict__"):
-                deck_config_json = dict(cfg.__dict__)
-
-        analyzer = DeckAnalyzer(self.deck)
+            deck_config_json = _dump_config(self.deck.config)
+
+        analyzer = self._get_analyzer()
         
         return {
             "name": self.deck.name,
@@ -106,6 +154,7 @@ class DeckExporter:
         Returns:
             str: Decklist formatted for MTG Arena import.
         """
+        inventory = self.deck.inventory
         output = []
         # Add Arena About header with deck name
         output.append("About")
@@ -125,15 +174,21 @@ class DeckExporter:
                 is_commander_deck = True
             elif hasattr(self.deck.config, 'deck') and hasattr(self.deck.config.deck, 'legalities'):
                 legalities = self.deck.config.deck.legalities
-                if any(format_name in ['commander', 'brawl', 'historicbrawl', 'standardbrawl'] for format_name in legalities):
+                if legalities and not _COMMANDER_FORMATS.isdisjoint(legalities):
                     is_commander_deck = True
         
         # Also check if deck has exactly 100 cards and singleton rule (common commander indicators)
         if not is_commander_deck:
-            total_cards = sum(self.deck.inventory.values())
-            max_copies = max(self.deck.inventory.values()) if self.deck.inventory else 0
-            if total_cards == 100 and max_copies == 1:
-                is_commander_deck = True
+            # One pass, stopping as soon as a duplicate or a 101st card rules it out
+            total_cards = 0
+            for qty in inventory.values():
+                if qty > 1:
+                    break
+                total_cards += qty
+                if total_cards > 100:
+                    break
+            else:
+                is_commander_deck = total_cards == 100
         
         if is_commander_deck:
             # Commander format - separate commander and deck sections
@@ -141,32 +196,28 @@ class DeckExporter:
             
             # Find and add commander card
             if commander_name:
-                # Look for the commander card in the deck
-                commander_found = False
-                for card in self.deck.cards.values():
-                    if card.name == commander_name:
-                        qty = self.deck.get_quantity(str(card.name))
-                        output.append(f"{qty} {card.name}")
-                        commander_found = True
-                        break
-                
-                if not commander_found:
+                # Cards are keyed by name, so try a direct lookup before scanning
+                cards = self.deck.cards
+                commander = cards.get(commander_name)
+                if commander is None or commander.name != commander_name:
+                    commander = next((card for card in cards.values() if card.name == commander_name), None)
+                if commander is not None:
+                    output.append(f"{inventory.get(str(commander.name), 0)} {commander.name}")
+                else:
                     # Commander not found in deck, add it anyway
                     output.append(f"1 {commander_name}")
             
             output.append("\nDeck")
             
             # Add all other cards (excluding commander if it was already added)
-            for card in self.deck.cards.values():
-                if commander_name and card.name == commander_name:
-                    continue  # Skip commander as it was already added
-                qty = self.deck.get_quantity(str(card.name))
-                output.append(f"{qty} {card.name}")
+            output.extend([
+                f"{inventory.get(name, 0)} {card.name}"
+                for name, card in self.deck.cards.items()
+                if not (commander_name and card.name == commander_name)
+            ])
         else:
             # Standard format - all cards in Deck section
             output.append("\nDeck")
-            for card in self.deck.cards.values():
-                qty = self.deck.get_quantity(str(card.name))
-                output.append(f"{qty} {card.name}")
+            output.extend([f"{inventory.get(name, 0)} {card.name}" for name, card in self.deck.cards.items()])
         
         return "\n".join(output) 
\ No newline at end of file
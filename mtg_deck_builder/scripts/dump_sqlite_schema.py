@@ -1,25 +1,32 @@
+import contextlib
 import sqlite3
 
 SQLITE_PATH = "data/mtgjson/AllPrintings.sqlite"
 
 def dump_sqlite_schema(sqlite_path):
-    conn = sqlite3.connect(sqlite_path)
-    cursor = conn.cursor()
+    with contextlib.closing(sqlite3.connect(sqlite_path)) as conn:
+        cursor = conn.cursor()
 
-    # List all tables
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    tables = [row[0] for row in cursor.fetchall()]
-    print(f"Tables in {sqlite_path}:")
-    for table in tables:
-        print(f"\nTable: {table}")
-        cursor.execute(f"PRAGMA table_info('{table}')")
-        columns = cursor.fetchall()
-        print("  Columns:")
-        for col in columns:
-            # PRAGMA table_info returns: cid, name, type, notnull, dflt_value, pk
-            print(f"    {col[1]:<25} {col[2]:<15} {'NOT NULL' if col[3] else 'NULL'} "
-                  f"DEFAULT {col[4]!r} {'PRIMARY KEY' if col[5] else ''}")
-    conn.close()
+        # List all tables with their columns in one query (pragma_table_info as a
+        # table-valued function) instead of one PRAGMA round trip per table
+        cursor.execute(
+            "SELECT m.name, p.cid, p.name, p.type, p.\"notnull\", p.dflt_value, p.pk "
+            "FROM sqlite_master AS m LEFT JOIN pragma_table_info(m.name) AS p "
+            "WHERE m.type='table' ORDER BY m.rowid, p.cid;"
+        )
+        columns_by_table = {}
+        for table, *col in cursor.fetchall():
+            columns = columns_by_table.setdefault(table, [])
+            if col[0] is not None:
+                columns.append(col)
+        print(f"Tables in {sqlite_path}:")
+        for table, columns in columns_by_table.items():
+            print(f"\nTable: {table}")
+            print("  Columns:")
+            for col in columns:
+                # PRAGMA table_info returns: cid, name, type, notnull, dflt_value, pk
+                print(f"    {col[1]:<25} {col[2]:<15} {'NOT NULL' if col[3] else 'NULL'} "
+                      f"DEFAULT {col[4]!r} {'PRIMARY KEY' if col[5] else ''}")
 
 if __name__ == "__main__":
     dump_sqlite_schema(SQLITE_PATH) 
\ No newline at end of file
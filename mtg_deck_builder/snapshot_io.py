@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 from dataclasses import asdict, dataclass
@@ -7,6 +8,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from mtg_deck_builder.db.repository import SummaryCardRepository
 from mtg_deck_builder.models.deck import Deck
 from mtg_deck_builder.models.deck_exporter import DeckExporter
@@ -15,13 +21,25 @@ from mtg_deck_builder.models.deck_exporter import DeckExporter
 SNAPSHOT_VERSION = "1.0"
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_file_sha1(path: str, mtime_ns: int, size: int) -> str:
+    """
+    SHA-1 of a file, reused while the file is unchanged.
+
+    mtime_ns and size are only part of the cache key, so rewriting the file forces a
+    fresh hash; the sqlite file rarely changes between snapshots. The bounded cache keeps
+    a long-running process from holding a digest for every past version of the file.
+    """
+    with open(path, "rb") as f:
+        # file_digest reads in large blocks and hashes them outside the GIL
+        return hashlib.file_digest(f, "sha1").hexdigest()
+
+
 def _file_sha1(path: Path) -> Optional[str]:
     try:
-        h = hashlib.sha1()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
+        path = Path(path)
+        st = path.stat()
+        return _cached_file_sha1(str(path.resolve()), st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
         return None
 
@@ -77,21 +95,31 @@ def deck_to_snapshot(
 def save_snapshot(snapshot: Dict[str, Any], path: Path) -> None:
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
+    if orjson is not None:
+        # Same 2-space layout as json.dumps(indent=2); non-str keys are stringified like json does
+        path.write_bytes(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        path.write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
 
 
 def load_snapshot(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
     return json.loads(Path(path).read_text(encoding="utf-8"))
 
 
 def reconstruct_deck_from_snapshot(snapshot: Dict[str, Any], repo: SummaryCardRepository) -> Deck:
     deck = Deck(name=snapshot.get("config", {}).get("deck", {}).get("name", "Snapshot Deck"), session=repo.session)
+    rows = []
     for row in snapshot.get("deck", []):
         name = row.get("name")
         qty = int(row.get("qty") or 0)
-        if not name or qty <= 0:
-            continue
-        card = repo.find_by_name(name, exact=True)
+        if name and qty > 0:
+            rows.append((name, qty))
+    # One batched lookup instead of a query per row
+    cards_by_name = repo.find_by_names([name for name, _ in rows])
+    for name, qty in rows:
+        card = cards_by_name.get(name)
         if not card:
             continue
         deck.insert_card(card, quantity=qty)
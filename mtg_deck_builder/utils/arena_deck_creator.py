@@ -9,6 +9,7 @@ import logging
 from typing import Dict, Optional, List, Tuple, Any
 from mtg_deck_builder.db import get_session
 from mtg_deck_builder.db.repository import SummaryCardRepository
+from mtg_deck_builder.models.card import BASIC_LAND_NAMES
 from mtg_deck_builder.models.deck import Deck
 from mtg_deck_builder.utils.arena_parser import parse_arena_export
 
@@ -30,6 +31,11 @@ FORMAT_RULES = {
     # Add more formats as needed
 }
 
+_COLOR_NAMES = {"W": "White", "U": "Blue", "B": "Black", "R": "Red", "G": "Green"}
+
+# Formats validate_deck_format checks with the 60-card / 4-copy rules
+_SIXTY_CARD_FORMATS = frozenset({"standard", "alchemy", "pioneer", "modern", "legacy", "historic"})
+
 def create_deck_from_arena_import(
     arena_text: str, 
     deck_name: str = "Imported Deck",
@@ -77,8 +83,10 @@ def _create_deck_with_session(
         found_cards = 0
         illegal_cards = []
         
+        # Exact names are resolved with one batched query; only misses fall back to a lookup each
+        found_by_name = repo.find_by_names(list(card_quantities))
         for card_name, quantity in card_quantities.items():
-            card = repo.find_by_name(card_name)
+            card = found_by_name.get(card_name)
             # If not found, try searching for it as part of a DFC
             if not card:
                 card = repo.find_by_name(card_name, exact=False)
@@ -103,10 +111,8 @@ def _create_deck_with_session(
             
         deck = Deck(cards=deck_cards, name=deck_name, session=session)
         
-        # Set the quantities for found cards
-        for card_name, quantity in card_quantities.items():
-            if card_name in deck_cards:
-                deck.inventory[card_name] = quantity
+        # Set the quantities for found cards in one assignment
+        deck.inventory = {card_name: card_quantities[card_name] for card_name in deck_cards}
         
         logger.info(f"Successfully created deck '{deck_name}' with {found_cards} cards")
         if missing_cards:
@@ -146,14 +152,17 @@ def validate_arena_import_with_database(
             missing_cards = []
             illegal_cards = []
             banned_cards = []
-            format_rules = FORMAT_RULES.get(format.lower(), FORMAT_RULES["standard"]) if format else None
+            fmt_lower = format.lower() if format else None
+            format_rules = FORMAT_RULES.get(fmt_lower, FORMAT_RULES["standard"]) if format else None
+            # Existence and legality only need the name and legalities columns
+            legalities_by_name = repo.get_legalities_by_names(list(card_quantities))
             for card_name in card_quantities.keys():
-                card = repo.find_by_name(card_name)
-                if not card:
+                legalities = legalities_by_name.get(card_name)
+                if legalities is None:
                     missing_cards.append(card_name)
                 else:
                     # Check legality
-                    if format and hasattr(card, "is_legal_in") and not card.is_legal_in(format):
+                    if fmt_lower and legalities.get(fmt_lower, "") != "Legal":
                         illegal_cards.append(card_name)
                     # Check banlist
                     if format_rules and card_name in format_rules["banned"]:
@@ -176,7 +185,7 @@ def validate_arena_import_with_database(
                 # Max copies validation
                 for card_name, quantity in card_quantities.items():
                     # Skip basic land quantity checks
-                    if card_name in ['Plains', 'Island', 'Swamp', 'Mountain', 'Forest', 'Snow-Covered Plains', 'Snow-Covered Island', 'Snow-Covered Swamp', 'Snow-Covered Mountain', 'Snow-Covered Forest']:
+                    if card_name in BASIC_LAND_NAMES:
                         continue
                     
                     if quantity > format_rules["max_copies"]:
@@ -280,7 +289,8 @@ def validate_deck_format(deck: Deck, format: str) -> List[str]:
     
     total_cards = sum(deck.inventory.values())
     
-    if format.lower() == "commander":
+    fmt_lower = format.lower()
+    if fmt_lower == "commander":
         if total_cards != 100:
             errors.append(f"Commander deck must have exactly 100 cards, got {total_cards}")
         
@@ -293,7 +303,7 @@ def validate_deck_format(deck: Deck, format: str) -> List[str]:
             if not is_basic and quantity > 1:
                 errors.append(f"Too many copies of {card_name}: {quantity} (maximum 1 in Commander)")
                 
-    elif format.lower() in ["standard", "alchemy", "pioneer", "modern", "legacy", "historic"]:
+    elif fmt_lower in _SIXTY_CARD_FORMATS:
         if total_cards < 60:
             errors.append(f"{format.title()} deck must have at least 60 cards, got {total_cards}")
         
@@ -330,63 +340,57 @@ def analyze_deck_composition(deck: Deck) -> Dict[str, Any]:
     }
     
     total_cards = sum(deck.inventory.values())
+    mana_curve = analysis["mana_curve"]
+    color_distribution = analysis["color_distribution"]
+    type_distribution = analysis["type_distribution"]
+    rarity_distribution = analysis["rarity_distribution"]
 
-    # Mana curve analysis
+    land_count = 0
+    basic_lands = {}
+    non_basic_lands = {}
+
+    # One pass over the deck fills every bucket
     for card_name, quantity in deck.inventory.items():
         card = deck.cards.get(card_name)
-        if card and hasattr(card, 'mana_value'):
+        if not card:
+            continue
+        has_types = hasattr(card, 'types')
+        types = (card.types or []) if has_types else []
+        is_land = 'Land' in types
+
+        # Mana curve (non-land cards only)
+        if has_types and not is_land and hasattr(card, 'mana_value'):
             cmc = card.mana_value or 0
-            if hasattr(card, 'types') and 'Land' not in (card.types or []):
-                 analysis["mana_curve"][cmc] = analysis["mana_curve"].get(cmc, 0) + quantity
-    
-    # Color distribution
-    for card_name, quantity in deck.inventory.items():
-        card = deck.cards.get(card_name)
-        if card and hasattr(card, 'colors'):
+            mana_curve[cmc] = mana_curve.get(cmc, 0) + quantity
+
+        # Color distribution (non-land cards only)
+        if not is_land and hasattr(card, 'colors'):
             colors = card.colors or []
-            if hasattr(card, 'types') and 'Land' in (card.types or []):
-                continue
             if not colors:  # Colorless
-                analysis["color_distribution"]["Colorless"] = analysis["color_distribution"].get("Colorless", 0) + quantity
+                color_distribution["Colorless"] = color_distribution.get("Colorless", 0) + quantity
             else:
                 for color in colors:
-                    color_name = {"W": "White", "U": "Blue", "B": "Black", "R": "Red", "G": "Green"}.get(color, color)
-                    analysis["color_distribution"][color_name] = analysis["color_distribution"].get(color_name, 0) + quantity
-    
-    # Type distribution
-    for card_name, quantity in deck.inventory.items():
-        card = deck.cards.get(card_name)
-        if card and hasattr(card, 'types'):
-            types = card.types or []
-            # Use main type (e.g. Creature, Sorcery)
+                    color_name = _COLOR_NAMES.get(color, color)
+                    color_distribution[color_name] = color_distribution.get(color_name, 0) + quantity
+
+        # Type distribution, by main type (e.g. Creature, Sorcery)
+        if has_types:
             main_type = types[0] if types else "Unknown"
-            analysis["type_distribution"][main_type] = analysis["type_distribution"].get(main_type, 0) + quantity
-    
-    # Rarity distribution
-    for card_name, quantity in deck.inventory.items():
-        card = deck.cards.get(card_name)
-        if card and hasattr(card, 'rarity'):
-            rarity = card.rarity or "Unknown"
-            analysis["rarity_distribution"][rarity.capitalize()] = analysis["rarity_distribution"].get(rarity.capitalize(), 0) + quantity
-    
-    # Land analysis
-    land_count = 0
-    basic_lands = {}
-    non_basic_lands = {}
-    
-    for card_name, quantity in deck.inventory.items():
-        card = deck.cards.get(card_name)
-        if card and hasattr(card, 'types') and "Land" in (card.types or []):
+            type_distribution[main_type] = type_distribution.get(main_type, 0) + quantity
+
+        # Rarity distribution
+        if hasattr(card, 'rarity'):
+            rarity = (card.rarity or "Unknown").capitalize()
+            rarity_distribution[rarity] = rarity_distribution.get(rarity, 0) + quantity
+
+        # Land analysis
+        if is_land:
             land_count += quantity
-            is_basic = False
             if hasattr(card, 'supertypes') and 'Basic' in (card.supertypes or []):
-                is_basic = True
-            
-            if is_basic:
                 basic_lands[card_name] = basic_lands.get(card_name, 0) + quantity
             else:
                 non_basic_lands[card_name] = non_basic_lands.get(card_name, 0) + quantity
-    
+
     analysis["land_analysis"] = {
         "total_lands": land_count,
         "basic_lands": basic_lands,
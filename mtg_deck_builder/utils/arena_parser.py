@@ -3,8 +3,18 @@ import re
 import logging
 from typing import List, Dict, Optional, Tuple, Sequence
 
+from mtg_deck_builder.models.card import BASIC_LAND_NAMES
+
 logger = logging.getLogger(__name__)
 
+# Compiled once; every export line goes through these
+_LEAD_DIGIT = re.compile(r'^\d')
+_QTY_LINE = re.compile(r"^\d+\s+.+")
+# "QTY NAME [(SET) NUMBER]" in one pass: group 1 is the quantity, group 2 the name with any
+# trailing set/collector info left out. The name may match empty so that a line holding
+# only set info (e.g. "4 (M21) 193") is rejected by the caller rather than read as a name.
+_ARENA_LINE = re.compile(r'^(\d+)\s+(.*?)(?:\s*\([\w\d]+\)\s+[\w\d]+)?\s*$')
+
 
 def parse_arena_export_line(line: str) -> Optional[Tuple[int, str]]:
     """
@@ -17,22 +27,18 @@ def parse_arena_export_line(line: str) -> Optional[Tuple[int, str]]:
         return None
 
     # If the line does not start with a number, it's a section header and should be skipped.
-    if not re.match(r'^\d', line):
+    if not _LEAD_DIGIT.match(line):
         logger.debug(f"Skipping header line: {line}")
         return None
 
-    # Strip set and collector number info, e.g., " (M21) 193"
-    # This makes parsing the name much more reliable.
-    card_part = re.sub(r'\s*\([\w\d]+\)\s+[\w\d]+$', '', line).strip()
-
-    # Extract quantity and name from the remaining string
-    match = re.match(r'^(\d+)\s+(.*)', card_part)
-    if not match:
-        logger.warning(f"Could not extract quantity and name from: '{card_part}' (original: '{line}')")
+    # Extract quantity and name, leaving out set and collector number info, e.g., " (M21) 193"
+    match = _ARENA_LINE.match(line)
+    name_part = match.group(2).strip() if match else ""
+    if not name_part:
+        logger.warning(f"Could not extract quantity and name from: '{line}'")
         return None
 
     quantity = int(match.group(1))
-    name_part = match.group(2).strip()
 
     # Handle double-faced cards by taking the front face
     card_name = name_part.split('//')[0].strip()
@@ -52,6 +58,7 @@ def parse_arena_export(deck_lines: Sequence[str]) -> dict:
     sideboard_quantities = defaultdict(int)
     deck_name = None
     in_sideboard = False
+    match_line = _ARENA_LINE.match
 
     for idx, line in enumerate(deck_lines):
         line = line.strip()
@@ -68,16 +75,14 @@ def parse_arena_export(deck_lines: Sequence[str]) -> dict:
         if line.lower() == 'sideboard':
             in_sideboard = True
             continue
-        # Only process lines that start with a number and a space
-        if not re.match(r'^\d+\s', line):
-            continue
-        # Remove set/collector info (e.g., (GRN) 153)
-        card_part = re.sub(r'\s*\([\w\d]+\)\s+[\w\d]+$', '', line).strip()
-        match = re.match(r'^(\d+)\s+(.*)', card_part)
+        # Only process "QTY NAME" lines; set/collector info (e.g., (GRN) 153) is left out
+        match = match_line(line)
         if not match:
             continue
-        quantity = int(match.group(1))
         card_name = match.group(2).strip()
+        if not card_name:
+            continue
+        quantity = int(match.group(1))
         if in_sideboard:
             sideboard_quantities[card_name] += quantity
         else:
@@ -107,6 +112,7 @@ def validate_arena_import(text: str) -> Tuple[bool, List[str]]:
     if not any(line.strip() for line in lines):
         errors.append("Decklist is empty or contains only whitespace.")
     
+    qty_line = _QTY_LINE.match
     for i, line in enumerate(lines, 1):
         line = line.strip()
         if not line:
@@ -117,7 +123,7 @@ def validate_arena_import(text: str) -> Tuple[bool, List[str]]:
             continue
             
         # Check for quantity and name
-        if not re.match(r"^\d+\s+.+", line):
+        if not qty_line(line):
             errors.append(f"Line {i} does not match 'QTY CARD_NAME' format: '{line}'")
             
     return len(errors) == 0, errors
@@ -150,11 +156,7 @@ def validate_arena_import_for_format(deck_text: str, format_name: str, format_ru
 
     # Card copies
     for name, quantity in card_quantities.items():
-        is_basic_land = name in [
-            'Plains', 'Island', 'Swamp', 'Mountain', 'Forest',
-            'Snow-Covered Plains', 'Snow-Covered Island', 'Snow-Covered Swamp',
-            'Snow-Covered Mountain', 'Snow-Covered Forest', 'Wastes'
-        ]
+        is_basic_land = name in BASIC_LAND_NAMES
         if not is_basic_land and "max_copies" in rules and quantity > rules["max_copies"]:
             errors.append(f"Too many copies of '{name}' ({quantity}), max is {rules['max_copies']}.")
 
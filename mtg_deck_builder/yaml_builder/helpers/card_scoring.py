@@ -8,10 +8,11 @@ This module provides functions for scoring cards based on various criteria:
 - Mana cost penalties
 """
 
+import functools
 import logging
 import re
 from collections import Counter
-from typing import List, Optional, Union, Any
+from typing import FrozenSet, List, Optional, Tuple, Union, Any
 from mtg_deck_builder.models.deck_config import ScoringRulesMeta
 from mtg_deck_builder.yaml_builder.deck_build_classes import (
     DeckBuildContext,
@@ -21,9 +22,53 @@ from mtg_deck_builder.yaml_builder.deck_build_classes import (
 from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
 from mtg_deck_builder.yaml_builder.types import ScoredCard
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+def _is_regex(pattern: Any) -> bool:
+    return isinstance(pattern, str) and pattern.startswith("/") and pattern.endswith("/")
+
+
+@functools.lru_cache(maxsize=64)
+def _phrase_automaton(patterns: Tuple[Any, ...]):
+    """Build an Aho-Corasick automaton over the lowercased substring patterns.
+
+    Scoring rules are shared by every card in a build, so the automaton is cached
+    on the pattern tuple. Returns None when pyahocorasick is not installed or there
+    are no substring patterns.
+    """
+    if ahocorasick is None:
+        return None
+    phrases = {str(p).lower() for p in patterns if not _is_regex(p)}
+    phrases.discard("")
+    if not phrases:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+def _matched_phrases(patterns: Tuple[Any, ...], text: str) -> Optional[FrozenSet[str]]:
+    """Return every substring pattern found in ``text`` with one scan, or None without an automaton."""
+    automaton = _phrase_automaton(patterns)
+    if automaton is None:
+        return None
+    return frozenset(phrase for _, phrase in automaton.iter(text))
+
+
+def _contains(phrase: str, text: str, matched: Optional[FrozenSet[str]]) -> bool:
+    if matched is None or not phrase:
+        return phrase in text
+    return phrase in matched
+
+
 def _match_priority_text(card: Any, patterns: List[str]) -> bool:
     """Check if card text matches any priority patterns.
 
@@ -37,10 +82,13 @@ def _match_priority_text(card: Any, patterns: List[str]) -> bool:
     if not patterns:
         return False
 
-    # Handle None text safely
-    text = getattr(card, "text", "") or ""
-    text = text.lower()
+    # Summary cards keep a cached lowercase copy of their text
+    if isinstance(card, MTGJSONSummaryCard):
+        text = card.text_lower
+    else:
+        text = (getattr(card, "text", "") or "").lower()
 
+    matched = _matched_phrases(tuple(patterns), text)
     for pattern in patterns:
         if pattern.startswith("/") and pattern.endswith("/"):
             # Handle regex pattern
@@ -51,7 +99,7 @@ def _match_priority_text(card: Any, patterns: List[str]) -> bool:
             except re.error:
                 logger.warning(f"Invalid regex pattern: {pattern}")
                 continue
-        elif pattern.lower() in text:
+        elif _contains(pattern.lower(), text, matched):
             return True
 
     return False
@@ -118,12 +166,10 @@ def score_card(
 
     # Score based on text matches
     if scoring_rules.text_matches:
+        text_lower = card.text_lower
+        matched = _matched_phrases(tuple(scoring_rules.text_matches), text_lower)
         for pattern, weight in scoring_rules.text_matches.items():
-            if (
-                isinstance(pattern, str)
-                and pattern.startswith("/")
-                and pattern.endswith("/")
-            ):
+            if _is_regex(pattern):
                 # Handle regex pattern
                 try:
                     if re.search(
@@ -138,7 +184,7 @@ def score_card(
                         )
                 except re.error:
                     continue
-            elif str(pattern).lower() in (getattr(card, "text", "") or "").lower():
+            elif _contains(str(pattern).lower(), text_lower, matched):
                 scored_card.increase_score(
                     score=int(weight),
                     source="score_card",
@@ -147,9 +193,10 @@ def score_card(
 
     # Score based on card types
     if scoring_rules.type_bonus:
+        card_types = {t.lower() for t in (getattr(card, "types", []) or [])}
         # Basic type bonus
         for type_, weight in scoring_rules.type_bonus.get("basic_types", {}).items():
-            if type_.lower() in [t.lower() for t in (getattr(card, "types", []) or [])]:
+            if type_.lower() in card_types:
                 scored_card.increase_score(
                     score=int(weight),
                     source="score_card",
@@ -157,7 +204,7 @@ def score_card(
                 )
         # Sub type bonus
         for type_, weight in scoring_rules.type_bonus.get("sub_types", {}).items():
-            if type_.lower() in [t.lower() for t in (getattr(card, "types", []) or [])]:
+            if type_.lower() in card_types:
                 scored_card.increase_score(
                     score=int(weight),
                     source="score_card",
@@ -165,7 +212,7 @@ def score_card(
                 )
         # Super type bonus
         for type_, weight in scoring_rules.type_bonus.get("super_types", {}).items():
-            if type_.lower() in [t.lower() for t in (getattr(card, "types", []) or [])]:
+            if type_.lower() in card_types:
                 scored_card.increase_score(
                     score=int(weight),
                     source="score_card",
@@ -174,8 +221,9 @@ def score_card(
 
     # Score based on rarity
     if scoring_rules.rarity_bonus and getattr(card, "rarity", None):
+        card_rarity = card.rarity.lower()
         for rarity, weight in scoring_rules.rarity_bonus.items():
-            if rarity.lower() == getattr(card, "rarity", "").lower():
+            if rarity.lower() == card_rarity:
                 scored_card.increase_score(
                     score=int(weight),
                     source="score_card",
@@ -207,8 +207,24 @@ def _fill_categories(build_context: BuildContext, available_slots: int) -> None:
                     source="category_handling",
                     reason=f"Category matches: {category_name}",
                 )
+        # Both passes below only take cards that match the category (and, when declared,
+        # one of its preferred basic types), so drop the rest before sorting. The sort is
+        # stable, so the survivors keep the order a full sort would give them. The summary
+        # below still reports on every scored candidate.
+        eligible = [
+            sc
+            for sc in scored_cards
+            if category_matches(sc.card, category)
+            and (
+                not requires_type_match
+                or any(
+                    sc.card.matches_type(t)
+                    for t in category.preferred_basic_type_priority
+                )
+            )
+        ]
         # sort the cards by score (highest first)
-        scored_cards = sorted(scored_cards, reverse=True)
+        eligible.sort(reverse=True)
 
         current_total = context.get_total_cards()
         if current_total >= available_slots:
@@ -220,7 +236,7 @@ def _fill_categories(build_context: BuildContext, available_slots: int) -> None:
         # Add cards up to target, respecting available slots
         added_count = 0
 
-        for scored_card in scored_cards:
+        for scored_card in eligible:
             # Stop if we've reached category target or run out of slots
             if added_count >= desired_target or category_free_slots <= 0:
                 logger.info(
@@ -234,16 +250,6 @@ def _fill_categories(build_context: BuildContext, available_slots: int) -> None:
                 if deck_config.scoring_rules
                 else 0
             )
-            # Only consider cards that match this category in the normal pass
-            if not category_matches(scored_card.card, category):
-                continue
-            # If category declares preferred_basic_type_priority, enforce at least one type match
-            if requires_type_match:
-                if not any(
-                    scored_card.card.matches_type(t)
-                    for t in category.preferred_basic_type_priority
-                ):
-                    continue
             # Respect inventory when owned_cards_only is True
             owned_qty = int(getattr(scored_card.card, "quantity", 0) or 0)
             # Default to 1 copy if below threshold and not owned_only; otherwise clamp to ownership
@@ -295,7 +301,7 @@ def _fill_categories(build_context: BuildContext, available_slots: int) -> None:
             logger.info(
                 f"Not enough cards met threshold for {category_name} (added {added_count}/{desired_target}). Using fallback to add below-threshold matches."
             )
-            for scored_card in scored_cards:
+            for scored_card in eligible:
                 if added_count >= desired_target or category_free_slots <= 0:
                     break
                 card = scored_card.card
@@ -303,16 +309,6 @@ def _fill_categories(build_context: BuildContext, available_slots: int) -> None:
                     continue
                 if hasattr(card, "types") and "Land" in (card.types or []):
                     continue
-                # Only consider cards that actually match the category
-                if not category_matches(card, category):
-                    continue
-                # If category declares preferred types, enforce them in fallback too
-                if requires_type_match:
-                    if not any(
-                        card.matches_type(t)
-                        for t in category.preferred_basic_type_priority
-                    ):
-                        continue
                 owned_qty = int(getattr(card, "quantity", 0) or 0)
                 max_copies = min(
                     deck_config.deck.max_card_copies,
@@ -26,6 +26,7 @@ import logging
 
 from mtg_deck_builder.yaml_builder.deck_build_classes import BuildContext
 from mtg_deck_builder.yaml_builder.helpers.card_scoring import score_card
+from mtg_deck_builder.yaml_builder.helpers.validation import _check_color_identity
 from mtg_deck_builder.db.repository import SummaryCardRepository
 from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
 
@@ -202,35 +203,6 @@ def _distribute_basic_lands(
     logger.info(f"Basic lands added for colors: {lands_per_color}")
 
 
-def _check_color_identity(
-    card: MTGJSONSummaryCard,
-    colors: List[str],
-    color_match_mode: str,
-) -> bool:
-    """Check if a card's color identity matches the deck's colors.
-
-    Args:
-        card: Card to check
-        colors: List of allowed colors
-        color_match_mode: How to match colors ("exact", "subset", or "superset")
-
-    Returns:
-        True if card's colors match the requirements
-    """
-    if not colors:
-        return True
-
-    card_colors = set(getattr(card, "color_identity_list", []) or [])
-    deck_colors = set(colors)
-
-    if color_match_mode == "exact":
-        return card_colors == deck_colors
-    elif color_match_mode == "subset":
-        return card_colors.issubset(deck_colors)
-    else:  # superset
-        return card_colors.issuperset(deck_colors)
-
-
 def _check_ownership(
     card: MTGJSONSummaryCard,
 ) -> bool:
@@ -207,14 +207,17 @@ def _score_cards_with_quality_filter(
             reasons = _collect_score_reasons(card, config.scoring_rules, scored_card.score)
             scored_cards.append((scored_card.score, card, reasons))
     
-    # Sort by score (highest first)
-    scored_cards.sort(key=lambda x: x[0] or 0, reverse=True)
-    
-    # Filter by quality threshold if specified
+    # Filter by quality threshold if specified; filtering before the (stable) sort
+    # gives the same order while sorting only the cards that are kept
+    original_count = len(scored_cards)
     if min_score_threshold and min_score_threshold > 0:
-        original_count = len(scored_cards)
         scored_cards = [(score, card, reasons) for score, card, reasons in scored_cards 
                        if score and score >= min_score_threshold]
+
+    # Sort by score (highest first)
+    scored_cards.sort(key=lambda x: x[0] or 0, reverse=True)
+
+    if min_score_threshold and min_score_threshold > 0:
         filtered_count = len(scored_cards)
         
         if filtered_count < original_count:
@@ -222,9 +225,7 @@ def _score_cards_with_quality_filter(
             
             # Log top 5 highest-scoring cards that were filtered out
             if original_count > filtered_count:
-                all_scored = [(score, card, reasons) for score, card, reasons in scored_cards]
-                all_scored.sort(key=lambda x: x[0] or 0, reverse=True)
-                top_filtered = all_scored[:5]
+                top_filtered = scored_cards[:5]
                 logger.info(f"{source}: Top 5 highest-scoring cards that could've been picked:")
                 for score, card, reasons in top_filtered:
                     logger.info(f"  {card.name}: {score:.1f} - {', '.join(reasons)}")
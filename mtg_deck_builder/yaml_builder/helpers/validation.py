@@ -9,6 +9,7 @@ This module provides functions for:
 import logging
 from typing import List
 from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
+from mtg_deck_builder.models.card import COLOR_BITS, encode_colors
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,18 @@ def _check_color_identity(
     if not colors:
         return True
 
+    # Summary cards cache their identity as a WUBRG bitmask; compare masks when
+    # the deck colors are all plain WUBRG symbols too.
+    card_bits = card.color_identity_bits if isinstance(card, MTGJSONSummaryCard) else None
+    if card_bits is not None and all(c in COLOR_BITS for c in colors):
+        deck_bits = encode_colors(colors)
+        if color_match_mode == "exact":
+            return card_bits == deck_bits
+        elif color_match_mode == "subset":
+            return card_bits & ~deck_bits == 0
+        else:  # superset
+            return card_bits & deck_bits == deck_bits
+
     card_colors = set(getattr(card, "color_identity_list", []) or [])
     deck_colors = set(colors)
 
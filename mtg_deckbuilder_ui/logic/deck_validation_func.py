@@ -14,6 +14,7 @@ import pandas as pd
 
 from mtg_deck_builder.db.inventory import load_inventory_items
 from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
+from mtg_deck_builder.models.card import BASIC_LAND_NAMES
 from mtg_deck_builder.utils.arena_parser import parse_arena_export
 from mtg_deck_builder.db import get_session
 from mtg_deck_builder.db.repository import SummaryCardRepository
@@ -24,11 +25,8 @@ from mtg_deckbuilder_ui.app_config import app_config
 
 logger = logging.getLogger(__name__)
 
-BASIC_LANDS = {
-    'Plains', 'Island', 'Swamp', 'Mountain', 'Forest',
-    'Snow-Covered Plains', 'Snow-Covered Island', 'Snow-Covered Swamp',
-    'Snow-Covered Mountain', 'Snow-Covered Forest', 'Wastes'
-}
+# Shared frozenset of basic land names (unlimited copies, always "owned")
+BASIC_LANDS = BASIC_LAND_NAMES
 
 
 def get_owned_qty(card: Optional[MTGJSONSummaryCard], name: str) -> int:
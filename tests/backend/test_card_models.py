@@ -307,6 +307,27 @@ class TestPrinting:
         assert "Lightning Bolt" in repr_str
         assert "LEA" in repr_str
 
+    def test_printing_from_mtgjson_card(self):
+        """Test converting a MTGJSONCard row through the printing module."""
+        from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONCard
+        from mtg_deck_builder.models import printing as printing_module
+
+        card = MTGJSONCard(
+            uuid="test-uuid-123",
+            name="Lightning Bolt",
+            setCode="LEA",
+            colors='["R"]',
+            manaValue=1.0,
+        )
+
+        printing = printing_module.from_mtgjson_card(card)
+
+        assert printing_module.Printing is Printing
+        assert isinstance(printing, Printing)
+        assert printing.colors == ["R"]
+        assert printing.manaValue == 1.0
+        assert printing.originalType is None
+
 
 class TestSummaryCard:
     """Test SummaryCard model."""
@@ -374,6 +395,37 @@ class TestSummaryCard:
         assert card.has_keywords(["damage"])
         assert not card.has_keywords(["flying"])
 
+    def test_summary_card_color_identity_modes(self, sample_summary_card_data):
+        """Test bitmask color identity matching across modes."""
+        card = SummaryCard(**{**sample_summary_card_data, "color_identity": ["R", "G"]})
+
+        assert card.color_identity_bits == 8 | 16
+        assert card.matches_color_identity(["G", "R"], mode="exact")
+        assert not card.matches_color_identity(["R"], mode="exact")
+        assert card.matches_color_identity(["R", "G", "W"], mode="subset")
+        assert not card.matches_color_identity(["R"], mode="subset")
+        assert card.matches_color_identity(["G", "U"], mode="any")
+        assert not card.matches_color_identity(["U", "B"], mode="any")
+
+        # Reassigning color_identity refreshes the cached mask
+        card.color_identity = []
+        assert not card.matches_color_identity(["R"], mode="subset")
+        assert card.matches_color_identity(["R"], mode="subset", allow_colorless=True)
+
+    def test_summary_card_color_identity_non_wubrg_symbols(self, sample_summary_card_data):
+        """Test symbols outside WUBRG are compared as sets, not dropped from the mask."""
+        colorless = SummaryCard(**{**sample_summary_card_data, "color_identity": []})
+        blue = SummaryCard(**{**sample_summary_card_data, "color_identity": ["U"]})
+
+        assert not colorless.matches_color_identity(["C"], mode="exact", allow_colorless=True)
+        assert not blue.matches_color_identity(["u"], mode="subset")
+        assert blue.matches_color_identity(["U", "C"], mode="subset")
+
+        odd = SummaryCard(**{**sample_summary_card_data, "color_identity": ["X"]})
+        assert odd.color_identity_bits is None
+        assert odd.matches_color_identity(["X", "U"], mode="subset")
+        assert not odd.matches_color_identity(["U"], mode="subset")
+
     def test_summary_card_type_methods(self, sample_summary_card_data):
         """Test SummaryCard type checking methods."""
         card = SummaryCard(**sample_summary_card_data)
@@ -229,6 +229,50 @@ class TestSummaryCardRepository:
         assert result is not None
         assert result.name == "Lightning Bolt"
 
+    def test_repository_find_by_names(self, test_session):
+        """Test finding many cards by exact name in one call."""
+        card = MTGJSONSummaryCard(name="Lightning Bolt", type="Instant", rarity="common")
+        test_session.add(card)
+        test_session.commit()
+
+        repo = SummaryCardRepository(test_session)
+        result = repo.find_by_names(["Lightning Bolt", "lightning bolt", "Missing Card"])
+
+        assert list(result) == ["Lightning Bolt"]
+        assert result["Lightning Bolt"].name == "Lightning Bolt"
+        assert repo.find_by_names([]) == {}
+
+        in_memory = SummaryCardRepository(test_session, cards=[card])
+        assert in_memory.find_by_names(["Lightning Bolt"]) == {"Lightning Bolt": card}
+
+    def test_repository_get_all_cards_loads_inventory(self, test_session):
+        """Test get_all_cards returns cards with their inventory quantities."""
+        test_session.add_all([
+            MTGJSONSummaryCard(name="Lightning Bolt"),
+            MTGJSONSummaryCard(name="Black Lotus"),
+            InventoryItem(card_name="Lightning Bolt", quantity=3),
+        ])
+        test_session.commit()
+        test_session.expunge_all()
+
+        cards = {c.name: c for c in SummaryCardRepository(test_session).get_all_cards()}
+
+        assert cards["Lightning Bolt"].quantity == 3
+        assert cards["Black Lotus"].quantity == 0
+
+    def test_repository_get_legalities_by_names(self, test_session):
+        """Test bulk legality lookup returns only found names."""
+        test_session.add_all([
+            MTGJSONSummaryCard(name="Lightning Bolt", legalities={"modern": "Legal"}),
+            MTGJSONSummaryCard(name="Black Lotus"),
+        ])
+        test_session.commit()
+
+        repo = SummaryCardRepository(test_session)
+        result = repo.get_legalities_by_names(["Lightning Bolt", "Black Lotus", "Missing Card"])
+
+        assert result == {"Lightning Bolt": {"modern": "Legal"}, "Black Lotus": {}}
+
     def test_repository_filter_cards(self, test_session, sample_summary_card_data):
         """Test filtering cards."""
         # Create test summary card in database
@@ -322,6 +366,22 @@ class TestSummaryCardRepository:
         
         assert isinstance(legalities, dict)
 
+    def test_repository_in_memory_min_quantity(self, test_session):
+        """Test in-memory quantity filters share one cached inventory lookup."""
+        for name in ("Lightning Bolt", "Shock", "Opt"):
+            test_session.add(MTGJSONSummaryCard(name=name, type="Instant"))
+        test_session.add(InventoryItem(card_name="Lightning Bolt", quantity=4))
+        test_session.add(InventoryItem(card_name="Shock", quantity=1))
+        test_session.commit()
+
+        repo = SummaryCardRepository(test_session, test_session.query(MTGJSONSummaryCard).all())
+        owned = repo.filter_cards(min_quantity=1)
+        assert sorted(c.name for c in owned.cards) == ["Lightning Bolt", "Shock"]
+
+        playsets = owned.filter_by_inventory_quantity(4)
+        assert [c.name for c in playsets.cards] == ["Lightning Bolt"]
+        assert playsets._owned_qty_index is repo._owned_qty_index
+
 
 class TestDatabaseModels:
     """Test database models."""
@@ -353,6 +413,46 @@ class TestDatabaseModels:
         assert summary_card.manaValue == 1.0
         assert summary_card.rarity == "Common"
 
+    def test_summary_card_type_matching(self):
+        """Test cached type matching follows type reassignment."""
+        summary_card = MTGJSONSummaryCard(name="Llanowar Elves", type="Creature — Elf Druid")
+
+        assert summary_card.matches_type("creature")
+        assert summary_card.matches_type("Creature")
+        assert summary_card.matches_subtype("elf")
+        assert not summary_card.matches_type("land")
+
+        summary_card.type = "Land"
+        assert summary_card.matches_type("land")
+        assert not summary_card.matches_type("creature")
+
+    def test_summary_card_lowercase_cache(self):
+        """Test cached lowercase text and name follow reassignment."""
+        summary_card = MTGJSONSummaryCard(name="Llanowar Elves", text="{T}: Add {G}.")
+
+        assert summary_card.name_lower == "llanowar elves"
+        assert summary_card.matches_keyword("ADD")
+
+        summary_card.text = "Flying"
+        assert summary_card.text_lower == "flying"
+        assert not summary_card.matches_keyword("add")
+
+    def test_summary_card_is_legal_in(self):
+        """Test legality checks for single and multiple formats follow reassignment."""
+        summary_card = MTGJSONSummaryCard(
+            name="Lightning Bolt",
+            legalities={"modern": "Legal", "legacy": "Legal", "standard": "Not Legal"},
+        )
+
+        assert summary_card.is_legal_in("modern")
+        assert not summary_card.is_legal_in("standard")
+        assert summary_card.is_legal_in(["modern", "legacy"])
+        assert not summary_card.is_legal_in(["modern", "standard"])
+
+        summary_card.legalities = {"standard": "Legal"}
+        assert summary_card.is_legal_in("standard")
+        assert not summary_card.is_legal_in("modern")
+
     def test_set_db_creation(self, sample_set_data):
         """Test creating MTGJSONSet instance."""
         card_set = MTGJSONSet(**sample_set_data)
@@ -103,6 +103,30 @@ class TestDeckConfig:
         assert config.deck.colors == ["W", "B"]
         assert config.deck.size == 60
 
+    def test_deck_config_from_yaml_reloads_edited_file(self, temp_yaml_file, sample_deck_config):
+        """Test repeated loads are independent and pick up edits to the file."""
+        import yaml
+
+        first = DeckConfig.from_yaml(temp_yaml_file)
+        first.deck.colors.append("G")
+        assert DeckConfig.from_yaml(temp_yaml_file).deck.colors == ["W", "B"]
+
+        sample_deck_config["deck"]["name"] = "Renamed Deck Config"
+        with open(temp_yaml_file, "w") as f:
+            yaml.dump(sample_deck_config, f)
+        assert DeckConfig.from_yaml(temp_yaml_file).deck.name == "Renamed Deck Config"
+
+    def test_deck_config_from_many_yaml(self, temp_yaml_file, sample_deck_config, tmp_path):
+        """Test loading several YAML files keeps the input order."""
+        import yaml
+
+        sample_deck_config["deck"]["name"] = "Second Deck"
+        second = tmp_path / "second.yaml"
+        second.write_text(yaml.dump(sample_deck_config))
+
+        configs = DeckConfig.from_many_yaml([temp_yaml_file, second, temp_yaml_file])
+        assert [config.deck.name for config in configs] == ["Test Deck", "Second Deck", "Test Deck"]
+
     def test_deck_config_validation_valid(self, sample_deck_config):
         """Test that valid configuration passes validation."""
         config = DeckConfig(**sample_deck_config)
@@ -158,6 +158,13 @@ class TestDeck:
         assert len(instants) == 1
         assert instants[0].name == "Instant"
 
+        # Cached type lookups follow later inserts
+        artifact_creature = MagicMock()
+        artifact_creature.name = "Artifact Creature"
+        artifact_creature.types = ["Artifact", "Creature"]
+        deck.insert_card(artifact_creature, 1)
+        assert [card.name for card in deck.cards_by_type("creature")] == ["Creature", "Artifact Creature"]
+
     def test_deck_search_cards(self):
         """Test searching cards by text."""
         deck = Deck(name="Test Deck")
@@ -206,6 +213,10 @@ class TestDeck:
         with pytest.raises(ValueError):
             deck.sample_hand(10)
 
+        # The draw pool follows later inserts
+        deck.insert_card(card1, 4)
+        assert len(deck.sample_hand(10)) == 10
+
     def test_deck_to_dict(self):
         """Test converting deck to dictionary."""
         deck = Deck(name="Test Deck")
@@ -227,6 +238,46 @@ class TestDeck:
         assert deck_dict["cards"]["Card 1"]["quantity"] == 2
         assert deck_dict["cards"]["Card 2"]["quantity"] == 1
 
+    def test_deck_to_dict_meta_not_shared(self):
+        """Test mutating one to_dict() result does not leak into later calls."""
+        deck = Deck(name="Test Deck")
+        first = deck.to_dict()
+        if not first["keywords"]:
+            pytest.skip("keyword metadata not available")
+        key = next(iter(first["keywords"]))
+        first["keywords"][key] = "MUTATED"
+
+        assert Deck(name="Other").to_dict()["keywords"][key] != "MUTATED"
+        assert '"MUTATED"' not in deck.to_json()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_deck_to_json_round_trips_non_ascii(self, tmp_path, monkeypatch, use_orjson):
+        """Test a deck file with non-ASCII card names is written and read back as UTF-8."""
+        import mtg_deck_builder.models.deck as deck_module
+
+        if not use_orjson:
+            monkeypatch.setattr(deck_module, "orjson", None)
+        deck = Deck(name="Test Deck")
+        monkeypatch.setattr(deck, "_to_dict", lambda share_meta: {"cards": {"Lim-Dûl's Vault": 1}})
+        path = tmp_path / "deck.json"
+
+        deck.to_json(path)
+
+        assert deck_module.load_json(path) == {"cards": {"Lim-Dûl's Vault": 1}}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_deck_to_json_stringifies_non_str_keys(self, monkeypatch, use_orjson):
+        """Test non-str inventory keys serialize the same with or without orjson."""
+        import json
+        import mtg_deck_builder.models.deck as deck_module
+
+        if not use_orjson:
+            monkeypatch.setattr(deck_module, "orjson", None)
+        deck = Deck(name="Test Deck")
+        monkeypatch.setattr(deck, "_to_dict", lambda share_meta: {"inventory": {1: 2}})
+
+        assert json.loads(deck.to_json()) == {"inventory": {"1": 2}}
+
     def test_deck_repr(self):
         """Test deck string representation."""
         deck = Deck(name="Test Deck")
@@ -240,6 +291,56 @@ class TestDeck:
         assert "2" in repr_str  # total cards
 
 
+class TestDeckAnalyzer:
+    """Test DeckAnalyzer statistics."""
+
+    def test_average_mana_value_uses_deck_quantities(self):
+        """Test averages are weighted by deck quantity, including basic land stubs."""
+        from mtg_deck_builder.models.deck_analyzer import DeckAnalyzer
+        from mtg_deck_builder.yaml_builder.types import LandStub
+
+        deck = Deck(name="Test Deck")
+        bolt = MagicMock()
+        bolt.name = "Lightning Bolt"
+        bolt.converted_mana_cost = 1
+        bolt.text = "Lightning Bolt deals 3 damage to any target."
+        giant = MagicMock()
+        giant.name = "Hill Giant"
+        giant.converted_mana_cost = 4
+        giant.text = ""
+        deck.insert_card(bolt, 4)
+        deck.insert_card(giant, 2)
+        deck.insert_card(LandStub(name="Mountain", color="R"), 10)
+
+        analyzer = DeckAnalyzer(deck)
+        assert analyzer.average_mana_value() == pytest.approx(12 / 16)
+
+        # Cached stats are dropped once the deck changes
+        deck.insert_card(giant, 2)
+        assert analyzer.average_mana_value() == pytest.approx(20 / 18)
+
+    def test_synergy_reads_em_dash_subtypes(self, monkeypatch):
+        """Test creature subtypes after an em dash count toward type synergy."""
+        from mtg_deck_builder.models.deck_analyzer import DeckAnalyzer
+
+        deck = Deck(name="Test Deck")
+        druid = MagicMock()
+        druid.name = "Llanowar Elves"
+        druid.type = "Creature — Elf Druid"
+        druid.text = ""
+        lord = MagicMock()
+        lord.name = "Elvish Archdruid"
+        lord.type = "Creature — Elf Druid"
+        lord.text = "Other Elf creatures you control get +1/+1."
+        deck.insert_card(druid, 2)
+        deck.insert_card(lord, 2)
+
+        analyzer = DeckAnalyzer(deck)
+        monkeypatch.setattr(DeckAnalyzer, "_ALL_CREATURE_TYPES", frozenset({"elf", "druid", "goblin"}))
+        # Only the lord's text names a type (elf), so 2 of 4 cards have synergy
+        assert analyzer.synergy_score() == pytest.approx(5.0)
+
+
 class TestCardMeta:
     """Test card metadata utilities."""
 
@@ -9,11 +9,14 @@ These tests validate:
 import pytest
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, mock_open
 
 # Import the actual functions that exist
-from mtg_deck_builder.utils.arena_deck_creator import create_deck_from_arena_import, validate_arena_import_with_database
-from mtg_deck_builder.utils.arena_parser import parse_arena_export
+from mtg_deck_builder.utils.arena_deck_creator import (
+    analyze_deck_composition, create_deck_from_arena_import, validate_arena_import_with_database
+)
+from mtg_deck_builder.utils.arena_parser import parse_arena_export, validate_arena_import_for_format
 
 
 @pytest.fixture
@@ -52,6 +55,28 @@ class TestArenaDeckCreator:
         assert isinstance(is_valid, bool)
         assert isinstance(errors, list)
 
+    def test_analyze_deck_composition(self):
+        """Test deck composition buckets for spells and lands."""
+        bolt = SimpleNamespace(types=["Instant"], supertypes=[], colors=["R"], rarity="common", mana_value=1)
+        mountain = SimpleNamespace(types=["Land"], supertypes=["Basic"], colors=[], rarity="common", mana_value=0)
+        deck = SimpleNamespace(
+            inventory={"Lightning Bolt": 4, "Mountain": 16},
+            cards={"Lightning Bolt": bolt, "Mountain": mountain},
+        )
+
+        analysis = analyze_deck_composition(deck)
+
+        assert analysis["mana_curve"] == {1: 4}
+        assert analysis["color_distribution"] == {"Red": 4}
+        assert analysis["type_distribution"] == {"Instant": 4, "Land": 16}
+        assert analysis["rarity_distribution"] == {"Common": 20}
+        assert analysis["land_analysis"] == {
+            "total_lands": 16,
+            "basic_lands": {"Mountain": 16},
+            "non_basic_lands": {},
+            "land_percentage": 80.0,
+        }
+
 
 class TestArenaParser:
     """Test Arena parser functionality."""
@@ -110,4 +135,17 @@ Sideboard
         assert "main" in deck_data
         assert "sideboard" in deck_data
         assert "Lightning Bolt" in deck_data["main"]
-        assert "Counterspell" in deck_data["sideboard"] 
\ No newline at end of file
+        assert "Counterspell" in deck_data["sideboard"]
+
+    def test_validate_for_format_skips_basic_lands(self):
+        """Test that basic lands, including Wastes, are exempt from the copy limit."""
+        rules = {"standard": {"min_size": 1, "max_copies": 4}}
+        deck_text = """Deck
+20 Wastes
+20 Snow-Covered Island
+5 Lightning Bolt"""
+
+        is_valid, errors = validate_arena_import_for_format(deck_text, "Standard", rules)
+
+        assert not is_valid
+        assert errors == ["Too many copies of 'Lightning Bolt' (5), max is 4."]
@@ -369,4 +369,49 @@ class TestYAMLDeckBuilder:
         
         # This should handle the exception gracefully and return None
         result = build_deck_from_config(valid_config, mock_repository)
-        assert result is None 
\ No newline at end of file
+        assert result is None 
+
+
+class TestCardScoring:
+    """Test card scoring helpers."""
+
+    def test_score_card_text_and_type_matches_ignore_case(self):
+        """Test text, type and rarity bonuses match regardless of case."""
+        from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
+        from mtg_deck_builder.models.deck_config import ScoringRulesMeta
+        from mtg_deck_builder.yaml_builder.helpers.card_scoring import score_card
+
+        card = MTGJSONSummaryCard(
+            name="Serra Angel",
+            text="Flying, vigilance. When it enters, Draw a card.",
+            types=["Creature"],
+            rarity="Uncommon",
+        )
+        rules = ScoringRulesMeta(
+            text_matches={"draw a card": 3, "FLYING": 1, "destroy": 5},
+            type_bonus={"basic_types": {"creature": 2}},
+            rarity_bonus={"uncommon": 1},
+            mana_penalty={},
+        )
+
+        scored = score_card(card, rules)
+
+        assert scored.score == 7
+
+    def test_score_card_overlapping_text_matches(self, monkeypatch):
+        """Test nested text patterns all score, with and without pyahocorasick."""
+        from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
+        from mtg_deck_builder.models.deck_config import ScoringRulesMeta
+        from mtg_deck_builder.yaml_builder.helpers import card_scoring
+
+        card = MTGJSONSummaryCard(name="Divination", text="Draw two cards.")
+        rules = ScoringRulesMeta(
+            text_matches={"draw": 1, "draw two cards": 2, "two": 4, "discard": 8},
+            mana_penalty={},
+        )
+
+        assert card_scoring.score_card(card, rules).score == 7
+        monkeypatch.setattr(card_scoring, "ahocorasick", None)
+        card_scoring._phrase_automaton.cache_clear()
+        assert card_scoring.score_card(card, rules).score == 7
+        card_scoring._phrase_automaton.cache_clear()
@@ -9,6 +9,7 @@ from collections import defaultdict
 from typing import Dict
 from mtg_deck_builder.db.loader import load_inventory
 from mtg_deck_builder.db.mtgjson_models.cards import MTGJSONSummaryCard
+from mtg_deck_builder.models.card import BASIC_LAND_NAMES
 from mtg_deck_builder.utils.arena_parser import parse_arena_export
 from mtg_deck_builder.db import get_session
 from mtg_deck_builder.db.repository import SummaryCardRepository
@@ -22,11 +23,8 @@ try:
 except ImportError:
     HAS_CLIPBOARD = False
 
-BASIC_LANDS = {
-    'Plains', 'Island', 'Swamp', 'Mountain', 'Forest',
-    'Snow-Covered Plains', 'Snow-Covered Island', 'Snow-Covered Swamp',
-    'Snow-Covered Mountain', 'Snow-Covered Forest', 'Wastes'
-}
+# Shared frozenset of basic land names (unlimited copies, always "owned")
+BASIC_LANDS = BASIC_LAND_NAMES
 
 def get_owned_qty(card, name):
     if name in BASIC_LANDS: